@@ -8,35 +8,83 @@ Created on 2019/12/22
 
 __author__ = "Yihang Wu"
 
+import time
+
+_started = time.perf_counter()  # before the other imports, for the startup report
+
+import argparse
 import os
+import random
+from functools import partial
 from tkinter import Tk, Button
 
 from settings import Settings
-from components import Background, Bird, Tubes, Timer, get_photo_image
+from components import Background, Bird, GameLoop, Tubes, Timer, World, cache_image, get_photo_image, load_image
+from components import utils
+from components.atlas import Atlas
+from components.leaderboard import Leaderboard
+from components.replay import Recording, play
 
 
 class App(Tk, Settings):
-    _background_animation_speed = 720  # A scaled speed for background animation
-    _bird_descend_speed = 38.4  # A scaled speed for bird descending
     _bestscore = 0
     _score = 0
-    _buttons = []
+    _menu_tag = "Menu"  # tag of the title and the menu buttons
+    _scoreboard_tag = "Scoreboard"  # tag of the scoreboard and its texts
     _playing = False
     _paused = False
     _timer = Timer()
 
-    def __init__(self):
+    def __init__(self, profile_out=None, record_dir=None, replay=None, runtime=None, startup_report=False):
+
+        # Steps of startup and the time each one finished, printed by finish_startup() if startup_report
+        self._startup = [('imports', time.perf_counter())]
+        self._startup_report = startup_report
 
         Tk.__init__(self)
         self.set_options()
 
+        # An AsyncRuntime to run the game loop and side work under asyncio, or None for mainloop()
+        self._runtime = runtime
+
+        # Profiling, enabled by the HUD or by a file to write frames to
+        self._profile_out = profile_out
+        self._profiler = None
+        self._hud = None
+
+        # Every finished game is kept in the leaderboard, the scoreboard shows its top scores
+        self._leaderboard = Leaderboard(self.leaderboard_fp)
+        self._top_scores = []
+        self._top_scores_text = None
+
+        # The menu and the scoreboard are created once, then hidden during a game and shown after it
+        self._buttons = []
+        self._scoreboard = None  # ids of the texts of the scoreboard, once it is created
+
+        # Telemetry, a record of every game is appended to telemetry_fp
+        self._telemetry = None
+        self._frame_stats = None
+
+        # Directory to record every game in, or a Recording to replay
+        self._record_dir = record_dir
+        self._recording = None
+        self._replay = replay
+
         # Component
+        self._loop = None
+        self._world = None
         self._background = None
         self._bird = None
         self._tubes = None
+        self._autopilot = None  # Autopilot of the game if it has flown the bird, its games are not scores
+        self._autopilot_start = None  # after() handle of the next game the autopilot starts
+        self._quality = None  # AdaptiveQuality, kept from game to game
 
         # Window Size
-        if self.window_width and self.window_height:
+        if self._replay is not None:
+            self._width = self._replay.width
+            self._height = self._replay.height
+        elif self.window_width and self.window_height:
             self._width = self.window_width
             self._height = self.window_height
         else:
@@ -50,62 +98,47 @@ class App(Tk, Settings):
         self.attributes('-fullscreen', self.window_fullscreen)
         self['bg'] = 'black'  # Background color
 
-        # Check the integrity of game resources
+        self.mark_startup('window')
+
+        # Take the sprites from the atlas of this window size, if it has been built and is up to date
+        utils.atlas = Atlas.open(self.atlas_fp(self._width, self._height))
+
+        # PhotoImage objects, kept here while they are shown
+        self._start_button_image = None
+        self._exit_button_image = None
+        self._title_image = None
+        self._scoreboard_image = None
+
+        # Check the integrity of game resources, it only looks the files up, so it is done in lazy mode too
         for img_fp in self.images_fp:
             if not os.path.exists(img_fp):
                 raise FileNotFoundError(f'Cannot find resource:\n{img_fp}')
 
-        # Create a PhotoImage object for start button
-        self._start_button_image = get_photo_image(
-            image_path=self.start_button_fp,
-            width=int(self._width * self.button_scaled_width),
-            height=int(self._height * self.button_scaled_height),
-            close_after=True
-        )[0]
-
-        # Create a PhotoImage object for exit button
-        self._exit_button_image = get_photo_image(
-            image_path=self.exit_button_fp,
-            width=int(self._width * self.button_scaled_width),
-            height=int(self._height * self.button_scaled_height),
-            close_after=True
-        )[0]
-
-        # Create a PhotoImage object for title
-        self._title_image = get_photo_image(
-            image_path=self.title_fp,
-            width=int(self._width * self.title_scaled_width),
-            height=int(self._height * self.title_scaled_height),
-            close_after=True
-        )[0]
-
-        # Create a PhotoImage object for scoreboard
-        self._scoreboard_image = get_photo_image(
-            image_path=self.scoreboard_fp,
-            width=int(self._width * self.scoreboard_scaled_width),
-            height=int(self._height * self.scoreboard_scaled_height),
-            close_after=True
-        )[0]
-
-        # Set background animation speed according to window width
-        # 不知道数值是怎么得出来的
-        self._background_animation_speed = int(self._background_animation_speed / (self._width / 100))
-
-        # Set bird descend speed according to window height
-        self._bird_descend_speed = int(self._bird_descend_speed / (self._height / 100))
+        # With lazy assets the window is shown first, every image is loaded the first time it is shown
+        if self.startup_lazy_assets:
+            return
+
+        # Load the images of the menu, they stay in the sprite cache
+        # The scoreboard is only shown after a game, it is loaded by initialize() in the background
+        self.get_image(self.start_button_fp, self.button_scaled_width, self.button_scaled_height)
+        self.get_image(self.exit_button_fp, self.button_scaled_width, self.button_scaled_height)
+        self.get_image(self.title_fp, self.title_scaled_width, self.title_scaled_height)
+
+        self.mark_startup('images')
 
     def initialize(self):
         """
         Method to initialize necessary components, bind event
         """
 
-        # Load best score
-        self.load_score()
+        # Create the game loop which ticks every component
+        if self._runtime is not None:
+            self._loop = self._runtime.create_loop(self, rate=self.game_tick_rate)
+        else:
+            self._loop = GameLoop(self, rate=self.game_tick_rate)
 
         # Create background object
-        self._background = Background(
-            self, self._width, self._height, fp=self.background_fp, animation_speed=self._background_animation_speed
-        )
+        self._background = Background(self, self._width, self._height, fp=self.background_fp)
 
         self._background.focus_force()  # ? 获取焦点 ?
 
@@ -114,6 +147,8 @@ class App(Tk, Settings):
         self._background.bind(self.window_exit_event, self.close)
         self._background.bind(self.window_pause_event, self.pause)
         self._background.bind(self.window_pause_2_event, self.pause)
+        self._background.bind(self.window_hud_event, self.toggle_hud)
+        self._background.bind(self.window_autopilot_event, self.toggle_autopilot)
 
         # 用self.close注册"WM_DELETE_WINDOW"协议
         # 当用户使用窗口管理器显式关闭窗口时,调用self.close函数,先记录分数,再退出
@@ -121,17 +156,363 @@ class App(Tk, Settings):
 
         self._background.pack()  # Pack background object ?
 
+        # The menu and the scoreboard outlive the reset of the background at the start of a game
+        self._background.keep(self._menu_tag)
+        self._background.keep(self._scoreboard_tag)
+
+        self.mark_startup('background')
+
+        if self.startup_lazy_assets:
+            # Show the window with its background now, the menu follows
+            self.update()
+            self.mark_startup('first frame')
+
         self.create_title_image()
         self.create_menu_buttons()
 
-        self._bird = Bird(
-            self._background, self.gameover, self.bird_fp, self._width, self._height,
-            descend_speed=self._bird_descend_speed, jump_event=self.bird_event
-        )
+        self._world = self.create_world()
+
+        # The scoreboard and the bird are not needed before a game starts
+        if not self.startup_lazy_assets:
+            self.preload_images()
+            self._bird = self.create_bird()
+
+        if self._profile_out:
+            self.enable_profiler()
+
+        self.after_idle(self.finish_startup)
+
+        if self.autopilot:
+            self.schedule_autopilot_start()
+
+    def mark_startup(self, step):
+        self._startup.append((step, time.perf_counter()))
+
+    def finish_startup(self):
+        """
+        Called once the menu is created, draw it, print the startup report if asked to, then load the scores
+        """
+
+        self.update_idletasks()
+        self.mark_startup('menu' if self.startup_lazy_assets else 'first frame')
+
+        if self._startup_report:
+            print(self.startup_report())
+
+        # The leaderboard is opened, and bestscore_fp imported, once the window is shown
+        self.load_score()
+
+    def startup_report(self):
+        """
+        Return the time of each step of startup, from the start of the imports of app.py
+        """
+
+        lines = ['Startup' + (' (lazy assets)' if self.startup_lazy_assets else '')]
+
+        last = _started
+        for step, finished in self._startup:
+            lines.append(f'  {step:<12} {(finished - last) * 1000:8.1f} ms')
+            last = finished
+
+        lines.append(f'  {"total":<12} {(last - _started) * 1000:8.1f} ms')
+        return '\n'.join(lines)
+
+    @classmethod
+    def atlas_fp(cls, width, height):
+        """
+        Path of the atlas of a window size, next to the settings file
+        """
+
+        return os.path.join(os.path.dirname(cls.settings_fp), f'atlas-{width}x{height}.bin')
+
+    @classmethod
+    def atlas_sprites(cls, width, height):
+        """
+        Return (path, width, height) of every sprite the game shows in a window of that size
+        """
+
+        world = World(width, height)
+
+        def scaled(fp, scaled_width, scaled_height):
+            return fp, int(width * scaled_width), int(height * scaled_height)
+
+        return [
+            (cls.background_fp, width, height),
+            (cls.bird_fp, world.bird_w, world.bird_h),
+            (cls.tube_fp[0], world.tube_w, height),
+            (cls.tube_fp[1], world.tube_w, world.tube_h),
+            scaled(cls.start_button_fp, cls.button_scaled_width, cls.button_scaled_height),
+            scaled(cls.exit_button_fp, cls.button_scaled_width, cls.button_scaled_height),
+            scaled(cls.title_fp, cls.title_scaled_width, cls.title_scaled_height),
+            scaled(cls.scoreboard_fp, cls.scoreboard_scaled_width, cls.scoreboard_scaled_height),
+        ]
+
+    @classmethod
+    def build_atlas(cls, width, height):
+        """
+        Build the atlas of a window size, return its path
+        """
+
+        fp = cls.atlas_fp(width, height)
+        Atlas.build(fp, cls.atlas_sprites(width, height))
+        return fp
+
+    def get_image(self, fp, scaled_width, scaled_height):
+        """
+        Return the PhotoImage of an image file scaled to the window, loading it if it is not cached
+        """
+
+        return get_photo_image(image_path=fp, width=int(self._width * scaled_width),
+                               height=int(self._height * scaled_height), close_after=True)[0]
+
+    def enable_profiler(self):
+        """
+        Record frame time, subsystem cost and Tk calls of the game loop
+        """
+
+        if self._profiler is not None:
+            return
+
+        from components.profiler import Profiler
+
+        self._profiler = Profiler(history=self.profile_history if self._profile_out else 0)
+        self._profiler.instrument(self._background)
+        self._loop.profiler = self._profiler
+
+        if self._bird is not None:
+            self._bird.profiler = self._profiler
+
+    def toggle_hud(self, event=None):
+        """
+        Show or hide the HUD of the profiler
+        """
+
+        if self._hud is None:
+            from components.profiler import Hud
+
+            self.enable_profiler()
+            self._hud = Hud(self._background, self._profiler)
+
+            if self._playing:
+                self._loop.add('hud', self.render_tick('hud', self._hud.tick))
+
+        self._hud.toggle()
+
+    def toggle_autopilot(self, event=None):
+        """
+        Let the autopilot fly the bird, or take the bird back
+        Turned on at the menu it starts a game, turned on in game it takes over the bird from the next frame
+        """
+
+        if self._replay is not None:
+            return
+
+        self.autopilot = not self.autopilot
+
+        if self.autopilot:
+            if self._playing:
+                self.engage_autopilot()
+            else:
+                self.schedule_autopilot_start()
+
+        else:
+            self.cancel_autopilot_start()
+
+            # The game stays a game of the autopilot, it is not saved as a score
+            if self._world is not None:
+                self._world.pilot = None
+
+    def engage_autopilot(self):
+        """
+        Let a new autopilot fly the bird of the game
+        """
+
+        from components.autopilot import Autopilot
+
+        self._autopilot = Autopilot(self._world, horizon=self.autopilot_horizon,
+                                    budget=self.autopilot_budget_ms / 1000)
+        self._world.pilot = self._autopilot
+
+    def tick_autopilot(self, dt):
+        """
+        Plan the jumps of the autopilot while it flies the bird, called by the game loop before the world
+        """
+
+        if self._autopilot is not None and self._world.pilot is self._autopilot:
+            self._autopilot.tick(dt)
+
+    def schedule_autopilot_start(self):
+        """
+        Let the autopilot start a game after autopilot_restart_ms, the menu is shown until then
+        """
+
+        self.cancel_autopilot_start()
+        self._autopilot_start = self.after(self.autopilot_restart_ms, self.autopilot_start)
+
+    def autopilot_start(self):
+        self._autopilot_start = None
+        self.start()
+
+    def cancel_autopilot_start(self):
+        if self._autopilot_start is not None:
+            self.after_cancel(self._autopilot_start)
+            self._autopilot_start = None
+
+    def render_tick(self, name, tick):
+        """
+        Return the tick of a subsystem that draws, ticked less often by the adaptive quality when frames run late
+        """
+
+        if self._quality is None:
+            return tick
+
+        return self._quality.wrap(name, tick)
+
+    def create_world(self):
+        """
+        Create the world model of a game, which the components render
+        """
+
+        if self._replay is not None:
+            return self._replay.create_world()
+
+        world = World(self._width, self._height, seed=random.getrandbits(32))
+
+        if self._record_dir:
+            self._recording = Recording.of(world)
+            world.recorder = self._recording
+
+        return world
+
+    def create_bird(self):
+        """
+        Create the bird, which does not listen to keys when a game is replayed
+        """
+
+        if self._replay is not None:
+            bird = Bird(self._background, self._world, self.gameover, self.bird_fp, jump_event=None, jump_event_2=None)
+        else:
+            bird = Bird(self._background, self._world, self.gameover, self.bird_fp, jump_event=self.bird_event)
+
+        # Jumps are events, the profiler of the game loop times them apart from the subsystems
+        bird.profiler = self._profiler
+        return bird
+
+    def scoreboard_size(self):
+        return int(self._width * self.scoreboard_scaled_width), int(self._height * self.scoreboard_scaled_height)
+
+    def preload_images(self):
+        """
+        Decode and scale the images which are not shown right away, so that get_photo_image() finds them cached
+        """
+
+        width, height = self.scoreboard_size()
+
+        # Sprites of the atlas need no decoding
+        if utils.atlas is not None and (self.scoreboard_fp, width, height) in utils.atlas:
+            return
+
+        self.run_in_background(load_image, self.scoreboard_fp, width, height,
+                               callback=partial(cache_image, self.scoreboard_fp, width, height, None))
+
+    def save_game(self):
+        """
+        Add the last game to the leaderboard, then show the top scores
+        Replays are not added, they are not new games, and neither are the games of the autopilot
+        """
+
+        if self._replay is not None or self._autopilot is not None:
+            return
+
+        world = self._world
+        self.run_in_background(self.record_game, self._score, world.seed, round(self._timer.seconds(), 3),
+                               world.jumps, world.cause, callback=self.update_top_scores)
+
+    def record_game(self, score, seed, duration, jumps, cause):
+        """
+        Add a game to the leaderboard in its own transaction, return the top games
+        """
+
+        self._leaderboard.add(score, profile=self.player_profile, seed=seed, duration=duration, jumps=jumps,
+                              cause=cause)
+        return self._leaderboard.top(self.leaderboard_size)
+
+    def update_top_scores(self, games):
+        self._top_scores = [game.score for game in games]
+
+        # The scoreboard may already be shown when the leaderboard is written in the background
+        if self._top_scores_text is not None:
+            self._background.itemconfigure(self._top_scores_text, text=self.top_scores_text())
+
+    def top_scores_text(self):
+        return "Top: " + "  ".join(str(score) for score in self._top_scores)
+
+    def log_game(self):
+        """
+        Append the record of the last game to the telemetry log, which writes it in its own thread
+        """
+
+        if not self.telemetry_enabled or self._frame_stats is None:
+            return
+
+        if self._telemetry is None:
+            from components.telemetry import TelemetryLog
+            self._telemetry = TelemetryLog(self.telemetry_fp, max_bytes=self.telemetry_max_bytes,
+                                           backups=self.telemetry_backups)
+
+        world = self._world
+        self._telemetry.write({
+            'time': round(time.time(), 3),
+            'seed': world.seed,
+            'score': self._score,
+            'duration': round(self._timer.seconds(), 3),
+            'game_time': round(world.elapsed, 3),
+            'jumps': world.jumps,
+            'cause': world.cause,
+            'replay': self._replay is not None,
+            'autopilot': self._autopilot is not None,
+            'quality': self._quality.worst if self._quality is not None else None,
+            'frames': self._frame_stats.summary(),
+        })
+
+    def run_in_background(self, func, *args, callback=None):
+        """
+        Run blocking side work such as file I/O, then callback(result)
+        Under an AsyncRuntime func runs in a thread and callback runs later in the main thread,
+        otherwise both run right away
+        func must not use Tk
+        """
+
+        if self._runtime is not None:
+            self._runtime.submit(func, *args, callback=callback)
+            return
+
+        result = func(*args)
+        if callback is not None:
+            callback(result)
+
+    def save_recording(self):
+        """
+        Save the recording of the last game as <record_dir>/<time>-<seed>.fbr
+        """
+
+        if not self._record_dir or self._recording is None:
+            return
+
+        recording, self._recording = self._recording, None
+
+        name = f"{time.strftime('%Y%m%d-%H%M%S')}-{recording.seed}.fbr"
+        self.run_in_background(self.write_recording, recording, os.path.join(self._record_dir, name))
+
+    @staticmethod
+    def write_recording(recording, fp):
+        os.makedirs(os.path.dirname(fp), exist_ok=True)
+        recording.save(fp)
 
     def create_title_image(self):
+        self._title_image = self.get_image(self.title_fp, self.title_scaled_width, self.title_scaled_height)
         self._background.create_image(self._width // 2, self._height * self.title_scaled_pos_y,
-                                      image=self._title_image)
+                                      image=self._title_image, tag=self._menu_tag)
 
     def create_menu_buttons(self):
         """
@@ -140,6 +521,11 @@ class App(Tk, Settings):
 
         width = int(self._width * self.button_scaled_width)
 
+        self._start_button_image = self.get_image(self.start_button_fp, self.button_scaled_width,
+                                                  self.button_scaled_height)
+        self._exit_button_image = self.get_image(self.exit_button_fp, self.button_scaled_width,
+                                                 self.button_scaled_height)
+
         # Create a Button object for start_button
         start_button = Button(
             master=self,  # 按钮的父容器
@@ -154,7 +540,7 @@ class App(Tk, Settings):
         # Place the start_button in background (Canvas)
         self._buttons.append(self._background.create_window((self._width // 2) - width // 1.5,
                                                             int(self._height * self.button_scaled_pos_y),
-                                                            window=start_button))
+                                                            window=start_button, tag=self._menu_tag))
 
         # Create a Button object for exit_button
         exit_button = Button(
@@ -170,17 +556,30 @@ class App(Tk, Settings):
         # Place the exit_button in background (Canvas)
         self._buttons.append(self._background.create_window((self._width // 2) + width // 1.5,
                                                             int(self._height * self.button_scaled_pos_y),
-                                                            window=exit_button))
+                                                            window=exit_button, tag=self._menu_tag))
 
-    def delete_menu_buttons(self):
+    def hide_menu(self):
         """
-        Delete all menu buttons
+        Hide the title, the menu buttons and the scoreboard, without deleting them
         """
 
-        for button in self._buttons:
-            self._background.delete(button)
+        self._background.itemconfigure(self._menu_tag, state='hidden')
+        self._background.itemconfigure(self._scoreboard_tag, state='hidden')
 
-        self._buttons.clear()
+    def show_menu(self):
+        """
+        Show the title, the menu buttons and the scoreboard of the last game above the world
+        The scoreboard is created after the first game, later games only change its texts
+        """
+
+        if self._scoreboard is None:
+            self.create_scoreboard()
+        else:
+            self.update_scoreboard()
+
+        for tag in (self._menu_tag, self._scoreboard_tag):
+            self._background.itemconfigure(tag, state='normal')
+            self._background.tag_raise(tag)
 
     def create_scoreboard(self):
         """
@@ -190,8 +589,7 @@ class App(Tk, Settings):
         x = self._width // 2
         y = int(self._height * self.scoreboard_scaled_pos_y)
 
-        scoreboard_w = int(self._width * self.scoreboard_scaled_width)
-        scoreboard_h = int(self._height * self.scoreboard_scaled_height)
+        scoreboard_w, scoreboard_h = self.scoreboard_size()
 
         # Location of last game score
         score_x = x - scoreboard_w * 0.3
@@ -205,24 +603,50 @@ class App(Tk, Settings):
         time_x = x
         time_y = y + scoreboard_h * 0.25
 
+        # Location of top scores of the leaderboard
+        top_x = x
+        top_y = y + scoreboard_h * 0.38
+
         # Scoreboard font
         font = (self.scoreboard_font, int(0.02 * self._width + 0.5))
 
+        # Create a PhotoImage object for scoreboard, preload_images() has usually loaded it already
+        self._scoreboard_image = self.get_image(self.scoreboard_fp, self.scoreboard_scaled_width,
+                                                self.scoreboard_scaled_height)
+
         # Create image for scoreboard in background
-        self._background.create_image(x, y, image=self._scoreboard_image)
+        self._background.create_image(x, y, image=self._scoreboard_image, tag=self._scoreboard_tag)
+
+        self._scoreboard = {}
+
+        self._scoreboard['score'] = self._background.create_text(
+            score_x, score_y, fill=self.scoreboard_fill, font=font, tag=self._scoreboard_tag
+        )
 
-        self._background.create_text(
-            score_x, score_y, text=f"Score: {self._score}", fill=self.scoreboard_fill, font=font
+        self._scoreboard['bestscore'] = self._background.create_text(
+            bestscore_x, bestscore_y, fill=self.scoreboard_fill, font=font, tag=self._scoreboard_tag
         )
 
-        self._background.create_text(
-            bestscore_x, bestscore_y, text=f"Best Score: {self._bestscore}", fill=self.scoreboard_fill, font=font
+        self._scoreboard['time'] = self._background.create_text(
+            time_x, time_y, fill=self.scoreboard_fill, font=font, tag=self._scoreboard_tag
         )
 
-        self._background.create_text(
-            time_x, time_y, text=f"Time: {str(self._timer)}", fill=self.scoreboard_fill, font=font
+        self._top_scores_text = self._background.create_text(
+            top_x, top_y, text=self.top_scores_text(), fill=self.scoreboard_fill,
+            font=(self.scoreboard_font, int(0.015 * self._width + 0.5)), tag=self._scoreboard_tag
         )
 
+        self.update_scoreboard()
+
+    def update_scoreboard(self):
+        """
+        Show the score, best score and time of the last game on the scoreboard
+        """
+
+        self._background.itemconfigure(self._scoreboard['score'], text=f"Score: {self._score}")
+        self._background.itemconfigure(self._scoreboard['bestscore'], text=f"Best Score: {self._bestscore}")
+        self._background.itemconfigure(self._scoreboard['time'], text=f"Time: {str(self._timer)}")
+
     def start(self, event=None):
         """
         Start the game
@@ -235,38 +659,77 @@ class App(Tk, Settings):
 
         self._playing = True
 
+        # A player may start the game before the autopilot does
+        self.cancel_autopilot_start()
+
         # Reinitialize score and time
         self._score = 0
         self._timer.start()
 
-        # Remove menu buttons
-        self.delete_menu_buttons()
+        # Hide the menu, it is kept for the next game over
+        self.hide_menu()
 
         # Reset background
         self._background.reset()
 
-        if self.background_animation:
-            self._background.run()
+        self._world = self.create_world()
 
-        self._bird = Bird(
-            self._background, self.gameover, self.bird_fp, self._width, self._height,
-            descend_speed=self._bird_descend_speed, jump_event=self.bird_event
-        )
+        self._bird = self.create_bird()
 
         self._tubes = Tubes(
-            self._background, self._bird, self._width, self._height, score_function=self.increase_score,
-            tube_body_fp=self.tube_fp[0], tube_mouth_fp=self.tube_fp[1],
-            animation_speed=self._background_animation_speed
+            self._background, self._world, score_function=self.increase_score,
+            tube_body_fp=self.tube_fp[0], tube_mouth_fp=self.tube_fp[1]
         )
 
+        # Components are ticked in this order: plan the jumps, measure the frame, move the world, then draw it
+        self._loop.clear()
+
+        # The autopilot may be turned on in game, so it is always ticked when it flies the bird
+        self._autopilot = None
+        if self.autopilot and self._replay is None:
+            self.engage_autopilot()
+        self._loop.add('autopilot', self.tick_autopilot)
+
+        if self.adaptive_quality:
+            if self._quality is None:
+                from components.quality import AdaptiveQuality
+                self._quality = AdaptiveQuality(self._loop.interval / 1000)
+
+            self._quality.reset()
+            self._loop.add('quality', self._quality.tick)
+
+        self._loop.add('world', self._world.advance)
+        if self.background_animation:
+            self._loop.add('background', self.render_tick('background', self._background.tick))
+        self._loop.add('tubes', self.render_tick('tubes', self._tubes.draw))
+        # The score is reported every frame, however often the tubes are drawn
+        self._loop.add('score', self._tubes.report_score)
+        # The bird ends the game when it dies, so it is ticked after the tubes have been drawn and scored
+        self._loop.add('bird', self._bird.tick)
+
+        if self._hud is not None:
+            self._hud.reset()
+            self._loop.add('hud', self.render_tick('hud', self._hud.tick))
+
+        if self.telemetry_enabled:
+            if self._frame_stats is None:
+                from components.telemetry import FrameStats
+                self._frame_stats = FrameStats(self._loop)
+
+            self._frame_stats.reset()
+            self._loop.add('frames', self._frame_stats.tick)
+
         self._bird.start()
-        self._tubes.start()
+        self._loop.start()
 
     def pause(self, event=None):
         """
         Method to pause or resume the game
+        At the menu it stops the autopilot from starting the next game
         """
 
+        self.cancel_autopilot_start()
+
         if not self._playing:
             return
 
@@ -274,19 +737,15 @@ class App(Tk, Settings):
             self._paused = True
             self._timer.pause()
 
-            self._background.stop()
+            self._loop.stop()
             self._bird.stop()
-            self._tubes.stop()
 
         else:
             self._paused = False
             self._timer.resume()
 
-            self._background.resume()
-            if self.background_animation:
-                self._background.run()
             self._bird.resume()
-            self._tubes.resume()
+            self._loop.start()
 
     def close(self, event=None):
         """
@@ -294,15 +753,28 @@ class App(Tk, Settings):
         Argument event should be kept
         """
 
-        # Save socre
-        self.save_score()
+        self.cancel_autopilot_start()
+
+        # Every game is already saved in the leaderboard
+        self.run_in_background(self._leaderboard.close)
+
+        if self._profile_out and self._profiler is not None:
+            self.run_in_background(self._profiler.dump, self._profile_out)
+
+        # Wait for the writer thread to write the last records
+        if self._telemetry is not None:
+            self.run_in_background(self._telemetry.close)
 
         try:
-            self._background.stop()
-            self._bird.kill()
-            self._tubes.stop()
+            self._loop.stop()
+            if self._bird is not None:
+                self._bird.kill()
         finally:
-            quit()
+            if self._runtime is not None:
+                # The runtime exits once the score and the profile are written
+                self._runtime.stop()
+            else:
+                quit()
 
     def change_fullscreen_option(self, event=None):
         self.window_fullscreen = not self.window_fullscreen
@@ -311,25 +783,33 @@ class App(Tk, Settings):
     def increase_score(self):
         """
         Add one score, and update best score if needed
+        Replays and the games of the autopilot are not played by the player, they do not make a best score
         """
 
         self._score += 1
 
+        if self._replay is not None or self._autopilot is not None:
+            return
+
         if self._score > self._bestscore:
             self._bestscore = self._score
 
     def load_score(self):
+        self.run_in_background(self.read_score, callback=self.update_bestscore)
+        self.run_in_background(self._leaderboard.top, self.leaderboard_size, callback=self.update_top_scores)
 
-        try:
-            with open(self.bestscore_fp) as fin:
-                self._bestscore = int(fin.read(), 16)
-        except IOError:
-            with open(self.bestscore_fp, 'w') as fout:
-                fout.write(hex(self._bestscore))
+    def read_score(self):
+        """
+        Return the best score of the profile in the leaderboard
+        The best score in bestscore_fp, where older versions kept it, is added to the leaderboard once
+        """
+
+        self._leaderboard.import_bestscore(self.bestscore_fp, self.player_profile)
+        return self._leaderboard.best(self.player_profile)
 
-    def save_score(self):
-        with open(self.bestscore_fp, 'w') as fout:
-            fout.write(hex(self._bestscore))
+    def update_bestscore(self, score):
+        # A game may have been played while the score was being read
+        self._bestscore = max(self._bestscore, score)
 
     def gameover(self):
         """
@@ -338,23 +818,82 @@ class App(Tk, Settings):
 
         self._timer.stop()
 
-        self._background.stop()
-        self._tubes.stop()
+        self._loop.stop()
+
+        # The adaptive quality may have skipped drawing the tubes in the last frames, they stop where the bird died
+        self._tubes.draw()
+
+        self.save_recording()
+        self.save_game()
+        self.log_game()
 
         # Set _playing=False
         # 否则,按下Enter的时候,self.start()不会被运行,背景不被重置,依旧会动,并且会叠加
         self._playing = False
 
-        self.create_menu_buttons()
-        self.create_title_image()
-        self.create_scoreboard()
+        self.show_menu()
+
+        # On a kiosk the autopilot plays again and again
+        if self.autopilot and self._replay is None:
+            self.schedule_autopilot_start()
 
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Flappy Bird Lite")
+    parser.add_argument('--profile-out', default=None, help='write frame time and Tk calls of the last frames to a CSV')
+    parser.add_argument('--record', default=None, metavar='DIR', help='record the jumps of every game in DIR')
+    parser.add_argument('--replay', default=None, metavar='FILE', help='replay a recorded game')
+    parser.add_argument('--no-render', action='store_true', help='replay as fast as possible without a window')
+    parser.add_argument('--asyncio', action='store_true',
+                        help='run under an asyncio event loop, with file I/O in background threads')
+    parser.add_argument('--startup-report', action='store_true', help='print the time each step of startup took')
+    parser.add_argument('--build-atlas', default=None, nargs='?', const='', metavar='WIDTHxHEIGHT',
+                        help='pre-scale every image for a window size (default: the one in the settings) and exit')
+    args = parser.parse_args()
+
+    if args.build_atlas is not None:
+        if args.build_atlas:
+            try:
+                width, _, height = args.build_atlas.partition('x')
+                size = int(width), int(height)
+            except ValueError:
+                parser.error(f'--build-atlas expects WIDTHxHEIGHT, got {args.build_atlas!r}')
+        else:
+            Settings().set_options()
+            if not (Settings.window_width and Settings.window_height):
+                parser.error('--build-atlas needs WIDTHxHEIGHT when the settings have no window size')
+            size = Settings.window_width, Settings.window_height
+
+        print(f'Built {App.build_atlas(*size)}')
+        raise SystemExit
+
+    if args.no_render:
+        if not args.replay:
+            parser.error('--no-render needs --replay')
+
+        world = play(Recording.load(args.replay))
+        print(f'seed {world.seed}  score {world.score}  time {world.elapsed:.3f}s  '
+              f'steps {world.ticks}  jumps {world.jumps}  cause {world.cause or "timeout"}')
+        raise SystemExit
+
     try:
-        app = App()
-        app.initialize()
-        app.mainloop()
+        runtime = None
+        if args.asyncio:
+            import asyncio
+            from components.runtime import AsyncRuntime
+            runtime = AsyncRuntime(rate=Settings.async_event_rate)
+
+        app = App(
+            profile_out=args.profile_out, record_dir=args.record,
+            replay=Recording.load(args.replay) if args.replay else None, runtime=runtime,
+            startup_report=args.startup_report
+        )
+
+        if runtime is not None:
+            asyncio.run(runtime.run(app))
+        else:
+            app.initialize()
+            app.mainloop()
 
     except FileNotFoundError as e:
         print(e)
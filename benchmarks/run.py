@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+
+"""
+Run the benchmark scenarios and compare them with a baseline
+    python -m benchmarks.run --out results.json
+    python -m benchmarks.run --baseline benchmarks/baseline.json --threshold 0.1
+Exit with status 1 if a scenario regressed by more than the threshold
+Created on 2026/10/18
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+
+from .scenarios import Skip, scenarios
+
+
+def run(names):
+    results = {}
+
+    for name in names:
+        try:
+            result = scenarios[name]()
+        except Skip as e:
+            result = {"skipped": str(e)}
+
+        # A scenario measuring several things returns a result for each
+        parts = result if "value" not in result and "skipped" not in result else {name: result}
+
+        for part, result in parts.items():
+            results[part] = result
+            print(f"{part:<14} {format_result(result)}", file=sys.stderr)
+
+    return results
+
+
+def format_result(result):
+    if "skipped" in result:
+        return f"skipped ({result['skipped']})"
+    return f"{result['value']:.1f} {result['unit']}"
+
+
+def compare(results, baseline, threshold):
+    """
+    Return the names of scenarios that are worse than the baseline by more than threshold
+    """
+
+    regressions = []
+
+    for name, result in results.items():
+        base = baseline.get(name)
+        if "value" not in result or not base or "value" not in base:
+            continue
+
+        if result["higher_is_better"]:
+            worse = result["value"] < base["value"] * (1 - threshold)
+        else:
+            worse = result["value"] > base["value"] * (1 + threshold)
+
+        if worse:
+            regressions.append(name)
+            print(f"REGRESSION {name}: {result['value']:.1f} vs {base['value']:.1f} {result['unit']}",
+                  file=sys.stderr)
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run benchmark scenarios")
+    parser.add_argument('scenarios', nargs='*', help=f"scenarios to run (default: all of {', '.join(scenarios)})")
+    parser.add_argument('--out', default=None, help='write results to this JSON file')
+    parser.add_argument('--baseline', default=None, help='compare with the results in this JSON file')
+    parser.add_argument('--threshold', type=float, default=0.1, help='allowed regression, 0.1 means 10%%')
+    args = parser.parse_args()
+
+    for name in args.scenarios:
+        if name not in scenarios:
+            parser.error(f"unknown scenario {name!r}")
+
+    # Paths of Settings are relative to the root of the game
+    os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    results = run(args.scenarios or list(scenarios))
+    report = {"python": platform.python_version(), "machine": platform.machine(), "results": results}
+
+    if args.out:
+        with open(args.out, 'w') as fout:
+            json.dump(report, fout, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+    if args.baseline:
+        with open(args.baseline) as fin:
+            baseline = json.load(fin)["results"]
+
+        if compare(results, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark scenarios
+Each scenario returns {"value": ..., "unit": ..., "higher_is_better": ...},
+or a dict of such results named "<scenario>:<what>" when it measures several things,
+or raises Skip when it cannot run on this machine (no display, no PIL, no NumPy)
+Created on 2026/10/18
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+from components.engine import World
+from settings import Settings
+
+scenarios = {}
+
+WIDTH = 1920
+HEIGHT = 1080
+
+
+class Skip(Exception):
+    """
+    The scenario cannot run here
+    """
+
+
+def scenario(name):
+    def register(function):
+        scenarios[name] = function
+        return function
+
+    return register
+
+
+def best_of(repeat, function):
+    """
+    Return the shortest time (s) of several runs of function
+    """
+
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def follow_gap(world):
+    y, velocity, distance, top, bottom = world.observe()
+    return y > (top + bottom) / 2 + (bottom - top) / 6 and velocity >= 0
+
+
+def tk_root():
+    """
+    Return a hidden Tk instance, or raise Skip
+    """
+
+    try:
+        import PIL.ImageTk  # noqa: F401
+        from tkinter import Tk, TclError
+    except ImportError as e:
+        raise Skip(str(e))
+
+    try:
+        root = Tk()
+    except TclError as e:
+        raise Skip(f"no display: {e}")
+
+    root.withdraw()
+    return root
+
+
+@scenario("engine_steps")
+def engine_steps(repeat=5, steps=50000):
+    """
+    Steps per second of the game logic, with a policy observing the world every step
+    """
+
+    def run():
+        world = World(WIDTH, HEIGHT, seed=0, immortal=True)
+        for _ in range(steps):
+            world.step(follow_gap(world))
+
+    return {"value": steps / best_of(repeat, run), "unit": "steps/s", "higher_is_better": True}
+
+
+@scenario("batch_steps")
+def batch_steps(repeat=3, steps=500, n=10000):
+    """
+    Steps per second of a batch of 10k birds
+    """
+
+    try:
+        import numpy as np
+        from components.batch import BatchWorld
+    except ImportError as e:
+        raise Skip(str(e))
+
+    def run():
+        batch = BatchWorld(n, WIDTH, HEIGHT, seed=0, immortal=True)
+        threshold = np.linspace(0.3, 0.8, n) * HEIGHT
+        for _ in range(steps):
+            batch.step(batch.y > threshold)
+
+    return {"value": steps / best_of(repeat, run), "unit": "steps/s", "higher_is_better": True}
+
+
+@scenario("headless_game")
+def headless_game(repeat=3, seconds=60):
+    """
+    Seconds of game played per second by the Tk components on a FakeCanvas, driven by the game loop
+    """
+
+    try:
+        from components import Bird, GameLoop, Tubes
+        from components.fakecanvas import FakeBackground, VirtualClock, headless
+    except ImportError as e:
+        raise Skip(str(e))
+
+    def run():
+        clock = VirtualClock()
+        world = World(WIDTH, HEIGHT, seed=0, immortal=True)
+
+        # The fake images do not outlive the block, the scenarios after this one use real ones
+        with headless():
+            background = FakeBackground(WIDTH, HEIGHT, fp=Settings.background_fp, clock=clock)
+            bird = Bird(background, world, lambda: None, Settings.bird_fp)
+            tubes = Tubes(background, world, lambda: None, tube_body_fp=Settings.tube_fp[0],
+                          tube_mouth_fp=Settings.tube_fp[1])
+
+        loop = GameLoop(background, clock=clock.monotonic)
+        loop.add('world', world.advance)
+        loop.add('background', background.tick)
+        loop.add('tubes', tubes.tick)
+        loop.add('bird', bird.tick)
+
+        def pilot():
+            if follow_gap(world):
+                bird.jumps()
+            background.after(loop.interval, pilot)
+
+        bird.start()
+        loop.start()
+        pilot()
+        clock.run(seconds * 1000)
+
+    return {"value": seconds / best_of(repeat, run), "unit": "game s/s", "higher_is_better": True}
+
+
+@scenario("collision")
+def collision(repeat=5, calls=100000):
+    """
+    Cost of a collision check with a pair of tubes in front of the bird
+    """
+
+    world = World(WIDTH, HEIGHT, seed=0, immortal=True)
+    pair = world.spawn()
+    pair.x = world.bird_x
+
+    top, bottom = world.gap_bounds(pair)
+    world.bird.y = (top + bottom) / 2
+
+    def run():
+        for _ in range(calls):
+            world.check_collision()
+
+    return {"value": best_of(repeat, run) / calls * 1e9, "unit": "ns/call", "higher_is_better": False}
+
+
+@scenario("tube_spawn")
+def tube_spawn(repeat=5, spawns=200):
+    """
+    Cost of drawing a newly spawned pair of tubes, once the item pool is warm
+    """
+
+    root = tk_root()
+
+    try:
+        from components import Background, Tubes
+
+        background = Background(root, WIDTH, HEIGHT, fp=Settings.background_fp)
+        world = World(WIDTH, HEIGHT, seed=0)
+        tubes = Tubes(background, world, lambda: None, tube_body_fp=Settings.tube_fp[0],
+                      tube_mouth_fp=Settings.tube_fp[1])
+
+        def run():
+            for _ in range(spawns):
+                tubes.create_tubes_pair(world.spawn())
+                world.tubes.popleft()
+                tubes.delete_tubes_pair()
+
+        run()
+        return {"value": best_of(repeat, run) / spawns * 1e6, "unit": "us/spawn", "higher_is_better": False}
+
+    finally:
+        root.destroy()
+
+
+@scenario("sprite_load")
+def sprite_load(repeat=3):
+    """
+    Images per second decoded, resized and made a PhotoImage, for each game image at the size the game shows it
+    Return a result per image, named sprite_load:<path>
+    """
+
+    root = tk_root()
+
+    try:
+        from app import App
+        from components.utils import get_photo_image, sprite_cache
+
+        results = {}
+
+        for fp, width, height in App.atlas_sprites(WIDTH, HEIGHT):
+            def run():
+                sprite_cache.clear()
+                get_photo_image(image_path=fp, width=width, height=height, close_after=True)
+
+            results[f"sprite_load:{fp}"] = {"value": 1 / best_of(repeat, run), "unit": "images/s",
+                                            "higher_is_better": True}
+
+        sprite_cache.clear()
+        return results
+
+    finally:
+        root.destroy()
+
+
+@scenario("cold_start")
+def cold_start(repeat=3):
+    """
+    Time from process launch to the first rendered menu
+    """
+
+    tk_root().destroy()
+
+    code = "from app import App; app = App(); app.initialize(); app.update(); app.destroy()"
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    def run():
+        subprocess.run([sys.executable, "-c", code], cwd=root, check=True)
+
+    return {"value": best_of(repeat, run) * 1000, "unit": "ms", "higher_is_better": False}
@@ -1,4 +1,37 @@
-from .background import Background
-from .bird import Bird
-from .tubes import Tubes
-from .utils import get_photo_image, Timer
+from importlib import import_module
+
+from .engine import World
+from .loop import GameLoop
+
+# Tk components are imported on first use, so that the engine can run without Tk
+# and the game starts without importing what it does not need yet. BatchWorld and the environments need NumPy
+_lazy = {
+    'AdaptiveQuality': '.quality',
+    'AsyncGameLoop': '.runtime',
+    'AsyncRuntime': '.runtime',
+    'Autopilot': '.autopilot',
+    'BatchWorld': '.batch',
+    'Background': '.background',
+    'Bird': '.bird',
+    'FakeBackground': '.fakecanvas',
+    'FakeCanvas': '.fakecanvas',
+    'FlappyEnv': '.env',
+    'FrameStats': '.telemetry',
+    'Hud': '.profiler',
+    'Profiler': '.profiler',
+    'TelemetryLog': '.telemetry',
+    'VectorEnv': '.env',
+    'VirtualClock': '.fakecanvas',
+    'Tubes': '.tubes',
+    'cache_image': '.utils',
+    'get_photo_image': '.utils',
+    'load_image': '.utils',
+    'sprite_cache': '.utils',
+    'Timer': '.utils',
+}
+
+
+def __getattr__(name):
+    if name in _lazy:
+        return getattr(import_module(_lazy[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+
+"""
+Atlas class
+Every sprite of the game scaled for one window size, packed in a single file, so that a launch
+maps one file instead of decoding and resizing each image
+    python app.py --build-atlas 1920x1080
+Created on 2026/10/18
+"""
+
+import json
+import mmap
+import os
+import struct
+
+_MAGIC = b'FBAT'
+_VERSION = 1
+
+# magic, version, length of the index
+_HEADER = struct.Struct('<4sBI')
+
+
+def file_hash(fp):
+    # Only needed when building or when an image has been touched, hashlib is slow to import
+    import hashlib
+
+    with open(fp, 'rb') as fin:
+        return hashlib.sha256(fin.read()).hexdigest()
+
+
+class Atlas:
+    """
+    Class for a texture atlas
+
+    The file is a header, a JSON index and the RGBA pixels of every sprite one after another.
+    The index gives the offset and size of each (path, width, height) sprite, and the size, modification time
+    and hash of each source image, so that an atlas is not used once an image has changed.
+    """
+
+    def __init__(self, index, buffer, fp=None):
+        self.fp = fp
+        self._index = index
+        self._buffer = buffer  # pixels, memory-mapped when loaded from a file
+        self._sprites = {(sprite['path'], sprite['width'], sprite['height']): sprite['offset']
+                         for sprite in index['sprites']}
+
+    def __len__(self):
+        return len(self._sprites)
+
+    def __contains__(self, key):
+        return key in self._sprites
+
+    @classmethod
+    def build(cls, fp, sprites):
+        """
+        Scale the images of sprites, a list of (path, width, height), and write them to fp
+        """
+
+        from .utils import load_image
+
+        index = {'sources': {}, 'sprites': []}
+        pixels = bytearray()
+
+        built = set()
+
+        for path, width, height in sprites:
+            if (path, width, height) in built:
+                continue
+            built.add((path, width, height))
+
+            if path not in index['sources']:
+                stat = os.stat(path)
+                index['sources'][path] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns,
+                                          'sha256': file_hash(path)}
+
+            image_resized, image = load_image(path, width, height)
+            data = image_resized.convert('RGBA').tobytes()
+
+            index['sprites'].append({'path': path, 'width': width, 'height': height, 'offset': len(pixels)})
+            pixels += data
+
+            image_resized.close()
+            image.close()
+
+        encoded = json.dumps(index).encode()
+
+        # Write a new file and replace the old one, a running game may have the old one mapped
+        directory = os.path.dirname(fp)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with open(fp + '.tmp', 'wb') as fout:
+            fout.write(_HEADER.pack(_MAGIC, _VERSION, len(encoded)))
+            fout.write(encoded)
+            fout.write(pixels)
+
+        os.replace(fp + '.tmp', fp)
+
+        return cls(index, pixels, fp)
+
+    @classmethod
+    def load(cls, fp):
+        """
+        Map the atlas in fp, the pixels are read from the file when a sprite is used
+        """
+
+        with open(fp, 'rb') as fin:
+            try:
+                buffer = mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                # Cannot be mapped (e.g. an empty file), read it instead
+                buffer = fin.read()
+
+        if len(buffer) < _HEADER.size:
+            raise ValueError(f'{fp} is not an atlas of this game')
+
+        magic, version, length = _HEADER.unpack_from(buffer)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f'{fp} is not an atlas of this game')
+
+        index = json.loads(bytes(buffer[_HEADER.size:_HEADER.size + length]))
+
+        return cls(index, memoryview(buffer)[_HEADER.size + length:], fp)
+
+    @classmethod
+    def open(cls, fp):
+        """
+        Return the atlas in fp, or None if there is none or its images have changed since it was built
+        """
+
+        try:
+            atlas = cls.load(fp)
+        except (OSError, ValueError):
+            return None
+
+        return atlas if atlas.valid() else None
+
+    def valid(self) -> bool:
+        """
+        Check that every source image is the one the atlas was built from
+        Images whose size and modification time are unchanged are not read again
+        """
+
+        for path, source in self._index['sources'].items():
+            try:
+                stat = os.stat(path)
+            except OSError:
+                return False
+
+            if stat.st_size == source['size'] and stat.st_mtime_ns == source['mtime_ns']:
+                continue
+
+            if stat.st_size != source['size'] or file_hash(path) != source['sha256']:
+                return False
+
+        return True
+
+    def get(self, path, width, height):
+        """
+        Return the sprite of path scaled to width x height as a PIL image, or None if it is not in the atlas
+        The image shares the memory of the atlas
+        """
+
+        offset = self._sprites.get((path, width, height))
+        if offset is None:
+            return None
+
+        import PIL.Image
+
+        size = width * height * 4
+        return PIL.Image.frombuffer('RGBA', (width, height), self._buffer[offset:offset + size], 'raw', 'RGBA', 0, 1)
@@ -0,0 +1,259 @@
+# -*- coding: utf-8 -*-
+
+"""
+Autopilot class
+A player which flies the bird by searching ahead with the physics of the World
+    autopilot = Autopilot(world, horizon=0.5, budget=0.002)
+    world.pilot = autopilot
+    loop.add('autopilot', autopilot.tick)  # before the world
+Created on 2026/10/18
+"""
+
+import time
+
+
+class Autopilot:
+    """
+    Class for an autopilot
+
+    A plan is a list of decisions, to jump or not, one every interval steps from the tick start.
+    Every frame, tick() simulates the plan with the rules of World.step() against the tubes on screen,
+    keeps the decisions that keep the bird alive and searches for the rest, depth first and trying the decisions
+    of the old plan first, until the plan looks horizon seconds ahead or the budget of the frame is spent.
+    Branches in which the bird dies are pruned, and so are the states that the search has already seen die.
+    The world asks the autopilot at every step, as its pilot, whether to jump.
+    """
+
+    def __init__(self, world, horizon=0.5, budget=0.002, interval=0.02, margin=0.01, clock=time.perf_counter):
+
+        if not budget > 0:
+            raise ValueError("Argument budget must be positive")
+
+        self.world = world
+
+        self.interval = max(round(interval / world.time_step), 1)  # steps between two decisions
+        self.depth = max(round(horizon / (self.interval * world.time_step)), 1)  # decisions of a full plan
+        self.budget = budget  # seconds of a frame that the search may take
+        self.margin = margin * world.height  # pixels kept between the bird and the tubes or the edges
+
+        self._clock = clock
+
+        self._plan = []  # True to jump
+        self._start = world.ticks  # tick of the first decision of the plan
+        self._pairs = []  # (x, top, bottom) of the pairs of tubes ahead of the bird, when the plan was made
+
+        # Search state
+        self._best = []
+        self._dead = set()
+        self._deadline = 0
+
+        # Counters, for reports
+        self.nodes = 0  # decisions simulated
+        self.searches = 0  # frames in which the plan was searched
+        self.timeouts = 0  # searches stopped by the budget
+
+    def __call__(self, world):
+        """
+        Return whether to jump at this step of the world
+        """
+
+        self._align(world.ticks)
+        return world.ticks == self._start and bool(self._plan) and self._plan[0]
+
+    def _align(self, ticks):
+        """
+        Drop the decisions of the steps that have passed
+        """
+
+        if self._start < ticks:
+            passed = -(-(ticks - self._start) // self.interval)
+            del self._plan[:passed]
+            self._start += passed * self.interval
+
+    def tick(self, dt=None):
+        """
+        Bring the plan up to date, called by the game loop before the world is advanced
+        """
+
+        world = self.world
+        bird = world.bird
+
+        if not bird.alive:
+            return
+
+        self._deadline = self._clock() + self.budget
+        self._align(world.ticks)
+
+        half_w = world.tube_w // 2
+        half_h = world.tube_h // 2
+        self._pairs = [(pair.x, pair.y + half_h, pair.y + world.gap + world.tube_h - half_h)
+                       for pair in world.tubes if pair.x + half_w >= world.hit_x1]
+
+        # The decision of the steps before the next one has been taken already
+        lead = self._start - world.ticks
+        state = self._run(bird.y, bird.velocity, 0, lead, False)
+
+        if state is None:
+            # Nothing can be done any more
+            return
+
+        # Keep the decisions that still keep the bird alive
+        plan = self._plan
+        kept = 0
+        end = state
+
+        for jump in plan:
+            after = self._run(end[0], end[1], lead + kept * self.interval, self.interval, jump)
+            if after is None:
+                break
+            end = after
+            kept += 1
+
+        if kept == self.depth:
+            return
+
+        self.searches += 1
+        hints = plan[kept:]
+
+        complete, tail = self._search(end, lead + kept * self.interval, self.depth - kept, hints)
+
+        if not complete and kept and self._clock() < self._deadline:
+            # The kept decisions lead nowhere, search again from the next decision
+            complete, full = self._search(state, lead, self.depth, plan)
+            if complete or len(full) > kept + len(tail):
+                plan[:] = full
+                return
+
+        plan[kept:] = tail
+
+    def _search(self, state, offset, depth, hints):
+        """
+        Search depth decisions from state, offset steps from now
+        Return whether they keep the bird alive, and the decisions which keep it alive the longest
+        """
+
+        self._best = []
+        self._dead.clear()
+
+        complete = self._visit(state[0], state[1], offset, 0, depth, hints, [])
+        if complete is None:
+            self.timeouts += 1
+
+        return bool(complete), self._best
+
+    def _visit(self, y, velocity, offset, level, depth, hints, path):
+        """
+        Return True if path can be completed to depth decisions, False if it cannot, None if out of time
+        """
+
+        if len(path) > len(self._best):
+            self._best = path[:]
+
+        if level == depth:
+            return True
+
+        if self._clock() > self._deadline:
+            return None
+
+        key = (level, int(y), int(velocity))
+        if key in self._dead:
+            return False
+
+        if level < len(hints):
+            order = (hints[level], not hints[level])
+        else:
+            order = (True, False) if self._below_target(y, velocity, offset) else (False, True)
+
+        for jump in order:
+            self.nodes += 1
+
+            state = self._run(y, velocity, offset, self.interval, jump)
+            if state is None:
+                continue
+
+            path.append(jump)
+            found = self._visit(state[0], state[1], offset + self.interval, level + 1, depth, hints, path)
+            if found or found is None:
+                return found
+            path.pop()
+
+        self._dead.add(key)
+        return False
+
+    def _below_target(self, y, velocity, offset):
+        """
+        Whether the bird is falling below the lower third of the gap it goes to, where evaluate.follow_gap jumps
+        A jump from there does not reach the top tube
+        """
+
+        world = self.world
+        target = world.height / 2
+
+        for x, top, bottom in self._pairs:
+            if x - world.move * offset + world.tube_w // 2 >= world.hit_x1:
+                target = bottom - (bottom - top) / 3
+                break
+
+        return y > target and velocity >= 0
+
+    def _run(self, y, velocity, offset, steps, jump):
+        """
+        Simulate steps steps of the bird from y and velocity, offset steps from now, as World.step()
+        Return (y, velocity) at the end, or None if the bird dies
+        """
+
+        world = self.world
+        margin = self.margin
+
+        half_w = world.tube_w // 2
+        half_bird_h = world.bird_h // 2
+        top_edge = -20 + margin
+        bottom_edge = world.height + 20 - margin - world.bird_h
+        acceleration = world.gravity * world.time_step
+
+        for step in range(offset, offset + steps):
+            if jump:
+                velocity = -world.jump_strength
+                jump = False
+
+            # World.check_collision()
+            y1 = y - half_bird_h
+            if y1 <= top_edge or y1 >= bottom_edge:
+                return None
+
+            for x, top, bottom in self._pairs:
+                x -= world.move * step
+                if x + half_w >= world.hit_x1:
+                    if x - half_w <= world.hit_x2 and (y - world.hit_top <= top + margin
+                                                       or y + world.hit_bottom >= bottom - margin):
+                        return None
+                    break
+
+            # World.fall()
+            velocity = min(velocity + acceleration, world.max_descend)
+            y += velocity * world.time_step
+
+        return y, velocity
+
+
+if __name__ == "__main__":
+    from .engine import World
+
+    _world = World(1920, 1080, seed=0)
+    _autopilot = Autopilot(_world)
+    _world.pilot = _autopilot
+
+    # Plan every 4 steps, as a game loop at 60 frames per second
+    _costs = []
+    while _world.bird.alive and _world.elapsed < 600:
+        _start = time.perf_counter()
+        _autopilot.tick()
+        _costs.append(time.perf_counter() - _start)
+
+        for _i in range(4):
+            _world.step()
+
+    _costs.sort()
+    print(f"score {_world.score} in {_world.elapsed:.0f} s ({_world.cause or 'alive'}), "
+          f"tick {sum(_costs) / len(_costs) * 1000:.3f} ms mean, {_costs[int(len(_costs) * 0.99)] * 1000:.3f} ms p99, "
+          f"{_autopilot.searches} searches, {_autopilot.timeouts} timeouts")
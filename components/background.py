@@ -2,7 +2,7 @@
 
 """
 Class - Background
-run() - make the background moving
+tick() - make the background moving
 Created on 2019/12/22
 """
 
@@ -10,26 +10,42 @@ __author__ = "Yihang Wu"
 
 from tkinter import Tk, Canvas
 
+from .engine import World
 from .utils import get_photo_image
 
 
 class Background(Canvas):
+    _tag = "Scroll"  # tag of the moving backgrounds
     _background = []  # list for background id
-    _stop = False  # indicate if the background is still rather than moving
+    _offset = 0  # distance that the moving backgrounds have moved since the left one was placed
 
-    def __init__(self, tk_instance, width, height, fp, animation_speed=50):
+    def __init__(self, tk_instance, width, height, fp, scroll_speed=None):
 
         if not isinstance(tk_instance, Tk):
             raise TypeError('Argument "tk_instance" must be an instance of Tk')
 
+        # The construction function of Canvas
+        Canvas.__init__(self, master=tk_instance, width=width, height=height)
+
+        self.setup(width, height, fp, scroll_speed)
+
+    def setup(self, width, height, fp, scroll_speed=None):
+        """
+        Load the background image and create the backgrounds, once the canvas is constructed
+        scroll_speed is in widths per second, the speed of the tubes by default
+        """
+
         self._width = width
         self._height = height
 
         self.image_path = fp
-        self.animation_speed = animation_speed
 
-        # The construction function of Canvas
-        Canvas.__init__(self, master=tk_instance, width=self._width, height=self._height)
+        if scroll_speed is None:
+            scroll_speed = World.scaled_scroll_speed
+        self.speed = scroll_speed * width  # pixels per second
+
+        self._background = []
+        self._keep = []  # tags of the items which reset() does not delete
 
         # Background image
         self._background_image = \
@@ -42,44 +58,56 @@ class Background(Canvas):
         # return id of that image
 
         # Create dynamic background
-        self._background.append(self.create_image(self._width // 2, self._height // 2, image=self._background_image))
         self._background.append(
-            self.create_image(self._width + (self._width // 2), self._height // 2, image=self._background_image))
+            self.create_image(self._width // 2, self._height // 2, image=self._background_image, tag=self._tag))
+        self._background.append(
+            self.create_image(self._width + (self._width // 2), self._height // 2, image=self._background_image,
+                              tag=self._tag))
+
+    def tick(self, dt):
+        """
+        Background animation, called by the game loop
+        Move the background by the distance of dt seconds
+        """
+
+        self.run(self.speed * dt)
 
-    def run(self):
+    def run(self, distance=10):
         """
-        Activate background animation
+        Move the background to the left by distance pixels
         """
 
-        if not self._stop:
-            self.move(self._background[0], -10, 0)
-            self.move(self._background[1], -10, 0)
-            # Canvas.move(PhotoImage, x, y) move PhotoImage x indent along x-axis and y indent along y-axis
-            self.tag_lower(self._background[0])
-            self.tag_lower(self._background[1])
-            self.tag_lower(self._background_default)
-            # self.tag_lower move the object to the lower level of canvas. 将图片移到最底下的图层 ??
+        # Move both backgrounds at once
+        self.move(self._tag, -distance, 0)
+        self._offset += distance
 
-            if self.bbox(self._background[0])[2] <= 0:
-                # Delete the image that left beyond the vision
-                self.delete(self._background[0])
-                self._background.remove(self._background[0])
+        if self._offset >= self._width:
+            # The left background is beyond the vision, move it behind the right one
+            self._offset -= self._width
+            self.move(self._background[0], self._width * 2, 0)
+            self._background.append(self._background.pop(0))
 
-                width = self.bbox(self._background[0])[2] + self._width // 2
-                self._background.append(self.create_image(width, self._height // 2, image=self._background_image))
+    def keep(self, tag):
+        """
+        Keep the items of tag when the background is reset, e.g. a menu which is shown and hidden
+        """
 
-            # execute this function every period of time
-            self.after(self.animation_speed, self.run)
+        if tag not in self._keep:
+            self._keep.append(tag)
 
     def reset(self):
         """
         Reset the background
         """
 
-        # delete all items in canvas
-        self.delete("all")
+        # delete all items in canvas, except the ones to keep
+        if self._keep:
+            kept = {item for tag in self._keep for item in self.find_withtag(tag)}
+            self.delete(*(item for item in self.find_all() if item not in kept))
+        else:
+            self.delete("all")
 
-        self._stop = False
+        self._offset = 0
 
         # Remove all items from list - self._background
         self._background.clear()
@@ -87,18 +115,12 @@ class Background(Canvas):
         # Redo create background
         self._background_default = self.create_image(self._width // 2, self._height // 2, image=self._background_image)
 
-        self._background.append(self.create_image(self._width // 2, self._height // 2, image=self._background_image))
         self._background.append(
-            self.create_image(self._width + (self._width // 2), self._height // 2, image=self._background_image))
-
-    def stop(self):
-        self._stop = True
-
-    def resume(self):
-        self._stop = False
+            self.create_image(self._width // 2, self._height // 2, image=self._background_image, tag=self._tag))
+        self._background.append(
+            self.create_image(self._width + (self._width // 2), self._height // 2, image=self._background_image,
+                              tag=self._tag))
 
-    def get_background_id(self):
-        """
-        Return backgrounds' ID in order to ignore collision with them
-        """
-        return [self._background_default, *self._background]
+        # The kept items stay above the new background
+        for tag in self._keep:
+            self.tag_raise(tag)
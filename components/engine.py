@@ -0,0 +1,469 @@
+# -*- coding: utf-8 -*-
+
+"""
+Game engine
+A pure-Python model of the game world (bird, tubes, score) which can be stepped without Tk.
+The Tk components render its state.
+Created on 2026/10/18
+"""
+
+import itertools
+import random
+
+
+class BirdBody:
+    """
+    State of the bird
+    """
+
+    __slots__ = ('y', 'velocity', 'alive')
+
+    def __init__(self, y):
+        self.y = y  # position y of the center of the bird
+        self.velocity = 0  # pixels per second that the bird moves down, negative when going up
+        self.alive = True
+
+
+class TubePair:
+    """
+    A pair of tubes in the same x position
+    """
+
+    __slots__ = ('x', 'y')
+
+    def __init__(self, x, y):
+        self.x = x  # position x of the center of the tubes
+        self.y = y  # position y of the center of the mouth of top tube
+
+
+class TubeRing:
+    """
+    Pairs of tubes from left to right, kept in a ring of TubePair which are reused
+
+    Pairs are numbered in the order they spawn, pair n is kept in slots[n % len(slots)].
+    first is the number of the left-most pair and end the number of the next pair to spawn,
+    so spawning and dropping a pair only moves a counter, and a renderer follows the pairs by their numbers.
+    A full ring doubles its capacity, the capacity given by World is enough for its tubes.
+    """
+
+    __slots__ = ('slots', 'first', 'end')
+
+    def __init__(self, capacity):
+        self.slots = [TubePair(0, 0) for _ in range(max(capacity, 1))]
+        self.first = 0
+        self.end = 0
+
+    def __len__(self):
+        return self.end - self.first
+
+    def __iter__(self):
+        slots = self.slots
+        capacity = len(slots)
+
+        # The pairs are one run of slots, or two when they wrap around the end of the ring
+        start = self.first % capacity
+        stop = start + self.end - self.first
+
+        if stop <= capacity:
+            return iter(slots[start:stop])
+
+        return itertools.chain(slots[start:], slots[:stop - capacity])
+
+    def __getitem__(self, index):
+        count = self.end - self.first
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("TubeRing index out of range")
+
+        return self.slots[(self.first + index) % len(self.slots)]
+
+    def pair(self, number):
+        """
+        Return the pair of a number between first and end
+        """
+
+        if not self.first <= number < self.end:
+            raise IndexError(f"Pair {number} is not in the ring")
+
+        return self.slots[number % len(self.slots)]
+
+    def append(self, x, y):
+        """
+        Spawn a pair at the right, return it
+        """
+
+        slots = self.slots
+        if self.end - self.first == len(slots):
+            slots = self._grow()
+
+        pair = slots[self.end % len(slots)]
+        pair.x = x
+        pair.y = y
+
+        self.end += 1
+        return pair
+
+    def popleft(self):
+        """
+        Drop the left-most pair, return it
+        Its slot is reused by a later pair, so it must not be kept
+        """
+
+        if self.first == self.end:
+            raise IndexError("pop from an empty TubeRing")
+
+        pair = self.slots[self.first % len(self.slots)]
+        self.first += 1
+        return pair
+
+    def clear(self):
+        self.first = self.end
+
+    def _grow(self):
+        old = self.slots
+        capacity = len(old) * 2
+
+        slots = [None] * capacity
+        for number in range(self.first, self.end):
+            slots[number % capacity] = old[number % len(old)]
+
+        self.slots = [pair if pair is not None else TubePair(0, 0) for pair in slots]
+        return self.slots
+
+
+class World:
+    """
+    Class for the game world
+
+    Speeds are fractions of the screen per second, so the game plays the same on every screen and frame rate.
+    step() runs a fixed time_step of simulation: it moves the bird by its velocity and scrolls the tubes.
+    advance() runs the steps that fall into a period of measured time, the rest is carried over,
+    so a game only depends on its seed and the steps at which the bird jumped.
+    A jump sets an upward velocity which gravity then slows down, so it needs no steps of its own.
+    """
+
+    # The game was tuned on a 1920x1080 screen, where it moved 10 pixels every 37 ms
+    # and the bird fell by a step every 3 ms
+    scaled_scroll_speed = 0.1408  # A scaled speed of tubes and background (widths per second)
+    scaled_gravity = 5.14  # A scaled acceleration of the bird falling (heights per second per second)
+    scaled_max_descend = 1.23  # A scaled value of maximum descend speed (heights per second)
+    scaled_max_climb = 0.0911  # A scaled value of the height of a jump
+
+    time_step = 0.004  # seconds of a step
+
+    def __init__(self, screen_width, screen_height, gravity=None, jump_strength=None, scroll_speed=None,
+                 time_step=None, seed=None, immortal=False, script=None):
+
+        self.width = screen_width
+        self.height = screen_height
+        self.immortal = immortal
+
+        if time_step is not None:
+            if not time_step > 0:
+                raise ValueError("Argument time_step must be positive")
+            self.time_step = time_step
+
+        # Size and position of the bird
+        self.bird_w = (self.width // 100) * 6
+        self.bird_h = (self.height // 100) * 11
+        self.bird_x = self.width // 2
+
+        # Set descends and climbs according to window height, speeds are in pixels per second
+        self.max_descend = self.scaled_max_descend * self.height
+        self.max_climb = int(self.scaled_max_climb * self.height + 0.5)
+
+        # Gravity (pixels per second per second) speeds the bird up to max_descend
+        # By default a jump is strong enough for the bird to rise max_climb before it falls again
+        if gravity is None:
+            gravity = self.scaled_gravity * self.height
+        self.gravity = gravity
+        if jump_strength is None:
+            jump_strength = (2 * self.gravity * self.max_climb) ** 0.5
+        self.jump_strength = jump_strength
+
+        # Set the speed of tubes (pixels per second) according to window width, and their move in a step
+        if scroll_speed is None:
+            scroll_speed = self.scaled_scroll_speed * self.width
+        self.scroll_speed = scroll_speed
+        self.move = self.scroll_speed * self.time_step
+
+        # Size of the tube mouth
+        self.tube_w = int(0.1 * self.width)
+        self.tube_h = int(0.05 * self.height)
+
+        # Minimum distance between two tubes
+        self.min_distance = int(self.tube_w * 4.5)
+
+        # Distance between the mouths of a pair of tubes
+        self.gap = self.bird_h * 2
+
+        # Box of the bird that collides with tubes, relative to the center of the bird
+        # Set a error value to each coordinate, in case it dies too precisely
+        self.hit_x1 = self.bird_x - self.bird_w // 2 + int(0.33 * self.bird_w)
+        self.hit_x2 = self.bird_x - self.bird_w // 2 + self.bird_w - int(0.26 * self.bird_w)
+        self.hit_top = self.bird_h // 2 - int(0.25 * self.bird_h)
+        self.hit_bottom = self.bird_h - self.bird_h // 2 - int(0.13 * self.bird_h)
+
+        self.seed = seed
+        self._random = random.Random(seed)
+
+        self.bird = BirdBody(self.height // 2)
+
+        # Pairs live from the right edge until they leave at the left, min_distance apart
+        self.tubes = TubeRing((self.width + self.tube_w * 2) // max(self.min_distance, 1) + 2)
+        self.score = 0
+        self.ticks = 0
+        self.scrolled = 0  # distance that the tubes have moved
+        self.cause = None  # cause of death, "bounds" or "tube"
+        self.jumps = 0
+
+        # Jumps are passed to recorder.record(tick) if it is set
+        self.recorder = None
+
+        # If pilot is set, pilot(world) is asked at every step whether to jump, e.g. an Autopilot
+        self.pilot = None
+
+        # Recorded jumps to replay, as (tick, action) in order of tick
+        self._script = list(reversed(script)) if script else []
+
+        self._distance = 0
+        self._clock = 0
+        self._unscored = 0  # number of the next pair of tubes that the bird has to pass
+
+    @property
+    def elapsed(self):
+        """
+        Seconds of game time that have been stepped
+        """
+        return self.ticks * self.time_step
+
+    def check_collision(self):
+        """
+        Check if the bird is out of window or hitting the nearest pair of tubes
+        """
+
+        bird = self.bird
+        y1 = bird.y - self.bird_h // 2
+
+        # If the bird gets out of the window, it dies
+        if y1 <= -20 or y1 + self.bird_h >= self.height + 20:
+            self.kill("bounds")
+
+        pair = self.nearest_pair()
+
+        if pair is not None and pair.x - self.tube_w // 2 <= self.hit_x2:
+            top, bottom = self.gap_bounds(pair)
+            if bird.y - self.hit_top <= top or bird.y + self.hit_bottom >= bottom:
+                self.kill("tube")
+
+        return not bird.alive
+
+    def nearest_pair(self):
+        """
+        Return the left-most pair of tubes which is not yet behind the bird, or None
+        The pairs that follow it are too far to touch the bird
+        """
+
+        return self.first_pair_after(self.hit_x1)
+
+    def kill(self, cause):
+        """
+        Kill the bird, keeping the first cause of death
+        """
+
+        if self.bird.alive:
+            self.bird.alive = False
+            self.cause = cause
+
+    def gap_bounds(self, pair):
+        """
+        Return the bottom of the top tube and the top of the bottom tube of a pair
+        """
+
+        half_h = self.tube_h // 2
+        return pair.y + half_h, pair.y + self.gap + self.tube_h - half_h
+
+    def next_pair(self):
+        """
+        Return the first pair of tubes that the bird has not passed, or None
+        """
+
+        return self.first_pair_after(self.bird_x - self.bird_w // 2)
+
+    def first_pair_after(self, x):
+        """
+        Return the left-most pair of tubes whose right side is not left of x, or None
+        """
+
+        tubes = self.tubes
+        slots = tubes.slots
+        capacity = len(slots)
+        half_w = self.tube_w // 2
+
+        for number in range(tubes.first, tubes.end):
+            pair = slots[number % capacity]
+            if pair.x + half_w >= x:
+                return pair
+
+        return None
+
+    def observe(self):
+        """
+        Return the observation of the bird
+        (y, velocity, distance to the next pair of tubes, top of the gap, bottom of the gap)
+        Velocity is in pixels per second, negative when going up
+        """
+
+        bird = self.bird
+
+        pair = self.next_pair()
+        if pair is None:
+            return bird.y, bird.velocity, self.width, 0, self.height
+
+        top, bottom = self.gap_bounds(pair)
+        return bird.y, bird.velocity, pair.x - self.bird_x, top, bottom
+
+    def jump(self):
+        """
+        Let the bird go up
+        """
+
+        if self.bird.alive:
+            self.bird.velocity = -self.jump_strength
+            self.jumps += 1
+
+            if self.recorder is not None:
+                self.recorder.record(self.ticks)
+
+    def fall(self):
+        """
+        Move the bird by its velocity, and let gravity act on it
+        Return whether the bird is alive
+        """
+
+        bird = self.bird
+
+        # Immortal Option
+        if self.immortal:
+            if bird.y - self.bird_h // 2 + self.bird_h >= self.height + 20 and bird.velocity >= 0:
+                return True
+        else:
+            self.check_collision()
+
+        if bird.alive:
+            bird.velocity = min(bird.velocity + self.gravity * self.time_step, self.max_descend)
+            bird.y += bird.velocity * self.time_step
+
+        return bird.alive
+
+    def spawn(self):
+        """
+        Create a pair of tubes at the right side
+        """
+
+        # Position y of the mouth of top tube
+        y = self._random.randint(self.tube_h // 2, self.height - self.tube_h - self.gap)
+
+        pair = self.tubes.append(self.width + self.tube_w, y)
+
+        # Set the distance to 0
+        self._distance = 0
+
+        return pair
+
+    def scroll(self):
+        """
+        Move tubes by one step, creating and eliminating tubes as needed
+        Return the score gained
+        """
+
+        tubes = self.tubes
+        slots = tubes.slots
+
+        # Eliminate the tubes that are out from left side
+        if tubes.first < tubes.end and slots[tubes.first % len(slots)].x + self.tube_w // 2 <= 0:
+            tubes.popleft()
+
+        # Whether to create a pair of tubes or not
+        if self._distance >= self.min_distance:
+            self.spawn()
+        else:
+            self._distance += self.move
+
+        # Coordinate x1 of the bird
+        b_x1 = (self.width - self.bird_w) / 2
+
+        scored = 0
+
+        # The ring may have grown when spawning
+        slots = tubes.slots
+        capacity = len(slots)
+
+        # Pairs are passed in order, so only the next pair to pass is checked
+        if self._unscored < tubes.end:
+            pair = slots[self._unscored % capacity]
+            x2 = pair.x + self.tube_w // 2
+
+            # If the bird will pass the tubes at this move, score it
+            if x2 <= b_x1:
+                if b_x1 - self.move < x2:
+                    scored = 1
+                self._unscored += 1
+
+        for number in range(tubes.first, tubes.end):
+            slots[number % capacity].x -= self.move
+
+        self.scrolled += self.move
+        self.score += scored
+        return scored
+
+    def step(self, jump=False):
+        """
+        Run one time_step of the game, moving the bird and then the tubes
+        Return whether the bird is alive
+        """
+
+        script = self._script
+        while script and script[-1][0] <= self.ticks:
+            script.pop()
+            jump = True
+
+        if self.pilot is not None and self.pilot(self):
+            jump = True
+
+        if jump:
+            self.jump()
+
+        alive = self.fall()
+        self.scroll()
+
+        self.ticks += 1
+        return alive
+
+    def advance(self, dt):
+        """
+        Run as many steps as fit into dt seconds, the rest is carried over to the next call
+        Return whether the bird is alive
+        """
+
+        self._clock += dt
+
+        while self._clock >= self.time_step and self.bird.alive:
+            self._clock -= self.time_step
+            self.step()
+
+        return self.bird.alive
+
+
+if __name__ == "__main__":
+    import time
+
+    _world = World(1920, 1080, seed=0, immortal=True)
+
+    _start = time.perf_counter()
+    for _i in range(100000):
+        _world.step(jump=_world.bird.y > _world.height * 0.6)
+    _cost = time.perf_counter() - _start
+
+    print(f"{_world.ticks / _cost:.0f} steps per second, score {_world.score}")
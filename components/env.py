@@ -0,0 +1,340 @@
+# -*- coding: utf-8 -*-
+
+"""
+FlappyEnv and VectorEnv classes
+The game as an environment to train jump policies on, with reset(seed) and step(action)
+    env = VectorEnv(256, seed=0)
+    observations = env.reset()
+    observations, rewards, dones, info = env.step(policy(observations))
+Created on 2026/10/18
+"""
+
+import random
+
+import numpy as np
+
+from .engine import World
+
+NOOP = 0  # action of doing nothing
+JUMP = 1  # action of a jump
+
+# Observation: bird y, bird velocity (pixels per second, negative when going up),
+# distance to the next pair of tubes, top and bottom of its gap, as in World.observe()
+OBSERVATION_SIZE = 5
+
+
+class FlappyEnv:
+    """
+    Class for one game as an environment
+
+    An action is NOOP or JUMP, it is taken at the first of frame_skip steps of the world.
+    The reward is the score gained by the steps, minus 1 when the bird dies.
+    A game is done when the bird dies or after max_time seconds of game time (then info["truncated"] is true).
+    """
+
+    def __init__(self, screen_width=1920, screen_height=1080, frame_skip=1, max_time=None, time_step=None):
+
+        if frame_skip < 1:
+            raise ValueError("Argument frame_skip must be at least 1")
+
+        self.width = screen_width
+        self.height = screen_height
+        self.frame_skip = frame_skip
+        self.max_time = max_time
+        self.time_step = time_step
+
+        self.world = None
+        self._max_ticks = None
+
+    def reset(self, seed=None):
+        """
+        Start a new game, of a random seed if seed is None
+        Return the first observation
+        """
+
+        if seed is None:
+            seed = random.getrandbits(32)
+
+        self.world = World(self.width, self.height, time_step=self.time_step, seed=seed)
+
+        if self.max_time is not None:
+            self._max_ticks = int(self.max_time / self.world.time_step)
+
+        return self.observe()
+
+    def observe(self):
+        return np.array(self.world.observe(), dtype=np.float32)
+
+    def step(self, action):
+        """
+        Return (observation, reward, done, info)
+        """
+
+        world = self.world
+        if world is None or not world.bird.alive:
+            raise RuntimeError("The game is over, call reset() first")
+
+        score = world.score
+
+        alive = world.step(jump=action == JUMP)
+        for _ in range(self.frame_skip - 1):
+            if not alive:
+                break
+            alive = world.step()
+
+        truncated = alive and self._max_ticks is not None and world.ticks >= self._max_ticks
+        reward = world.score - score - (0 if alive else 1)
+
+        info = {'score': world.score, 'ticks': world.ticks, 'seed': world.seed, 'cause': world.cause,
+                'truncated': truncated}
+
+        return self.observe(), float(reward), not alive or truncated, info
+
+
+class VectorEnv:
+    """
+    Class for k games stepped at once
+
+    The rules of World.step() are applied to arrays, one element per game, so a step costs a few NumPy calls
+    whatever k is. Each game has its own tubes in a ring of slots (as World.tubes), only the spawning of
+    a pair runs in Python, for the games that spawn one at that step, with the generator of World
+    so that a game of a seed is the game of World of that seed.
+
+    A game that is done is reset to a new seed at once: the observation returned for it is the first of
+    the new game, and info holds the score, ticks and seed of the game that ended.
+    """
+
+    def __init__(self, k, screen_width=1920, screen_height=1080, frame_skip=1, max_time=None, time_step=None,
+                 seed=None):
+
+        if k < 1:
+            raise ValueError("Argument k must be at least 1")
+
+        if frame_skip < 1:
+            raise ValueError("Argument frame_skip must be at least 1")
+
+        # A world gives the geometry and the rules, its own bird and tubes are not used
+        self.world = World(screen_width, screen_height, time_step=time_step)
+
+        self.k = k
+        self.frame_skip = frame_skip
+        self.max_time = max_time
+        self._max_ticks = int(max_time / self.world.time_step) if max_time is not None else None
+
+        # Seeds of the games which are reset without a seed
+        self._seeds = random.Random(seed)
+
+        world = self.world
+
+        # Pairs are spawned at least min_distance + move apart
+        self.capacity = int((world.width + world.tube_w * 2) / (world.min_distance + world.move)) + 2
+
+        self._rows = np.arange(k)
+
+        # States of the birds
+        self.y = np.zeros(k, dtype=np.float64)
+        self.velocity = np.zeros(k, dtype=np.float64)
+        self.alive = np.ones(k, dtype=bool)
+        self.score = np.zeros(k, dtype=np.int64)
+        self.ticks = np.zeros(k, dtype=np.int64)
+        self.seeds = np.zeros(k, dtype=np.int64)
+
+        # Tubes, pair n of a game is in column n % capacity
+        self.tube_x = np.zeros((k, self.capacity), dtype=np.float64)
+        self.tube_y = np.zeros((k, self.capacity), dtype=np.float64)
+        self.first = np.zeros(k, dtype=np.int64)  # number of the left-most pair
+        self.end = np.zeros(k, dtype=np.int64)  # number of the next pair to spawn
+        self.nearest = np.zeros(k, dtype=np.int64)  # number of the pair the bird may hit
+        self.unscored = np.zeros(k, dtype=np.int64)  # number of the next pair to pass
+        self.distance = np.zeros(k, dtype=np.float64)  # distance since the last spawn
+
+        self._randoms = [None] * k
+
+    def reset(self, seeds=None):
+        """
+        Start a new game in every environment, seeds is a list of k seeds or None for new ones
+        Return the first observations, an array of k x OBSERVATION_SIZE
+        """
+
+        if seeds is not None and len(seeds) != self.k:
+            raise ValueError(f"Expected {self.k} seeds, got {len(seeds)}")
+
+        self._reset(self._rows, seeds)
+        return self.observe()
+
+    def _reset(self, indexes, seeds=None):
+        world = self.world
+
+        self.y[indexes] = world.height // 2
+        self.velocity[indexes] = 0
+        self.alive[indexes] = True
+        self.score[indexes] = 0
+        self.ticks[indexes] = 0
+
+        self.first[indexes] = 0
+        self.end[indexes] = 0
+        self.nearest[indexes] = 0
+        self.unscored[indexes] = 0
+        self.distance[indexes] = 0
+
+        for i, index in enumerate(indexes):
+            seed = seeds[i] if seeds is not None else self._seeds.getrandbits(32)
+            self.seeds[index] = seed
+            self._randoms[index] = random.Random(seed)
+
+    def observe(self):
+        """
+        Return the observations of every game, as World.observe()
+        """
+
+        world = self.world
+
+        # The first pair that the bird has not passed, World.next_pair()
+        # It is the last scored pair or one of the two after it, the pairs before are far behind the bird
+        x1 = world.bird_x - world.bird_w // 2
+        half_w = world.tube_w // 2
+
+        number = np.maximum(self.unscored - 1, self.first)
+        for _ in range(2):
+            x = self.tube_x[self._rows, number % self.capacity]
+            number += (number < self.end) & (x + half_w < x1)
+
+        exists = number < self.end
+        columns = number % self.capacity
+        x = self.tube_x[self._rows, columns]
+        y = self.tube_y[self._rows, columns]
+
+        observations = np.empty((self.k, OBSERVATION_SIZE), dtype=np.float32)
+        observations[:, 0] = self.y
+        observations[:, 1] = self.velocity
+        observations[:, 2] = np.where(exists, x - world.bird_x, world.width)
+        observations[:, 3] = np.where(exists, y + world.tube_h // 2, 0)
+        observations[:, 4] = np.where(exists, y + world.gap + world.tube_h - world.tube_h // 2, world.height)
+
+        return observations
+
+    def step(self, actions):
+        """
+        Take an action in every game
+        Return (observations, rewards, dones, info), info being a dict of arrays
+        """
+
+        actions = np.asarray(actions)
+        if actions.shape != (self.k,):
+            raise ValueError(f"Expected {self.k} actions, got an array of shape {actions.shape}")
+
+        score = self.score.copy()
+
+        self._tick(self.alive.copy(), actions == JUMP)
+        for _ in range(self.frame_skip - 1):
+            self._tick(self.alive.copy())
+
+        alive = self.alive.copy()
+        truncated = alive & (self.ticks >= self._max_ticks) if self._max_ticks is not None else np.zeros_like(alive)
+        dones = ~alive | truncated
+
+        rewards = (self.score - score - ~alive).astype(np.float32)
+
+        info = {'score': self.score.copy(), 'ticks': self.ticks.copy(), 'seed': self.seeds.copy(),
+                'truncated': truncated}
+
+        done = np.flatnonzero(dones)
+        if done.size:
+            self._reset(done)
+
+        return self.observe(), rewards, dones, info
+
+    def _tick(self, active, jumps=None):
+        """
+        Run one step of World.step() for the games in active
+        """
+
+        world = self.world
+        rows = self._rows
+        capacity = self.capacity
+        half_w = world.tube_w // 2
+
+        if jumps is not None:
+            self.velocity[jumps & active] = -world.jump_strength
+
+        # World.check_collision(), with the nearest pair kept as a number which only goes up
+        y1 = self.y - world.bird_h // 2
+        hit = (y1 <= -20) | (y1 + world.bird_h >= world.height + 20)
+
+        x = self.tube_x[rows, self.nearest % capacity]
+        self.nearest += active & (self.nearest < self.end) & (x + half_w < world.hit_x1)
+
+        columns = self.nearest % capacity
+        x = self.tube_x[rows, columns]
+        y = self.tube_y[rows, columns]
+
+        top = y + world.tube_h // 2
+        bottom = y + world.gap + world.tube_h - world.tube_h // 2
+
+        hit |= ((self.nearest < self.end) & (x - half_w <= world.hit_x2)
+                & ((self.y - world.hit_top <= top) | (self.y + world.hit_bottom >= bottom)))
+
+        self.alive &= ~(hit & active)
+
+        # World.fall()
+        falling = active & self.alive
+        self.velocity[falling] = np.minimum(self.velocity[falling] + world.gravity * world.time_step,
+                                            world.max_descend)
+        self.y[falling] += self.velocity[falling] * world.time_step
+
+        # World.scroll(), eliminate the tubes that are out from left side
+        x = self.tube_x[rows, self.first % capacity]
+        self.first += active & (self.first < self.end) & (x + half_w <= 0)
+
+        spawn = active & (self.distance >= world.min_distance)
+        self.distance[active & ~spawn] += world.move
+
+        for index in np.flatnonzero(spawn):
+            self._spawn(index)
+
+        # Score the next pair to pass
+        b_x1 = (world.width - world.bird_w) / 2
+
+        x2 = self.tube_x[rows, self.unscored % capacity] + half_w
+        passed = active & (self.unscored < self.end) & (x2 <= b_x1)
+        self.score += passed & (b_x1 - world.move < x2)
+        self.unscored += passed
+
+        self.tube_x[active] -= world.move
+        self.ticks += active
+
+    def _spawn(self, index):
+        world = self.world
+
+        if self.end[index] - self.first[index] == self.capacity:
+            raise RuntimeError("Too many tubes for the capacity of the environment")
+
+        column = self.end[index] % self.capacity
+        self.tube_x[index, column] = world.width + world.tube_w
+        self.tube_y[index, column] = self._randoms[index].randint(world.tube_h // 2,
+                                                                  world.height - world.tube_h - world.gap)
+
+        self.end[index] += 1
+        self.distance[index] = 0
+
+
+if __name__ == "__main__":
+    import time
+
+    _env = VectorEnv(1024, frame_skip=4, seed=0)
+    _observations = _env.reset()
+
+    _games = _best = 0
+    _start = time.perf_counter()
+    for _i in range(5000):
+        # Jump when the bird falls below the middle of the gap, as evaluate.follow_gap
+        _middle = (_observations[:, 3] + _observations[:, 4]) / 2
+        _actions = (_observations[:, 0] > _middle + (_observations[:, 4] - _observations[:, 3]) / 6) \
+            & (_observations[:, 1] >= 0)
+
+        _observations, _rewards, _dones, _info = _env.step(_actions.astype(int))
+        _games += _dones.sum()
+        _best = max(_best, _info['score'].max())
+    _cost = time.perf_counter() - _start
+
+    print(f"{_env.k * 5000 / _cost:.0f} env steps per second, {_games} games, best score {_best}")
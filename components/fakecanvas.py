@@ -0,0 +1,418 @@
+# -*- coding: utf-8 -*-
+
+"""
+FakeCanvas class
+An in-memory stand-in of the Canvas used by the components, with a virtual clock for after()
+so that Background, Bird, Tubes and GameLoop run without a display and faster than real time
+    clock = VirtualClock()
+    with headless():  # the images of the components are FakePhotoImages
+        background = FakeBackground(1920, 1080, fp=Settings.background_fp, clock=clock)
+        ...
+    loop = GameLoop(background, clock=clock.monotonic)  # frames measured in virtual time
+    clock.run(60000)  # one minute of game
+Created on 2026/10/18
+"""
+
+import heapq
+import itertools
+import math
+from contextlib import contextmanager
+
+from . import utils
+from .background import Background
+
+
+class VirtualClock:
+    """
+    Class for a clock which runs after() callbacks in order of time, as fast as possible
+    """
+
+    def __init__(self):
+        self.now = 0  # ms
+        self._queue = []
+        self._cancelled = set()
+        self._count = itertools.count()
+
+    def after(self, ms, func, *args):
+        handle = f"after#{next(self._count)}"
+        heapq.heappush(self._queue, (self.now + int(ms), next(self._count), handle, func, args))
+        return handle
+
+    def cancel(self, handle):
+        self._cancelled.add(handle)
+
+    def pending(self):
+        return len(self._queue) - len(self._cancelled)
+
+    def monotonic(self):
+        """
+        Return the time in seconds, to be the clock of a GameLoop
+        """
+
+        return self.now / 1000
+
+    def run(self, ms):
+        """
+        Run the callbacks due in the next ms milliseconds
+        """
+
+        end = self.now + ms
+
+        while self._queue and self._queue[0][0] <= end:
+            due, _, handle, func, args = heapq.heappop(self._queue)
+
+            if handle in self._cancelled:
+                self._cancelled.discard(handle)
+                continue
+
+            self.now = due
+            func(*args)
+
+        self.now = end
+
+    def run_until(self, predicate, limit=None):
+        """
+        Run callbacks until predicate() is true, no callback is left or limit ms have passed
+        Return whether predicate() is true
+        """
+
+        end = self.now + limit if limit is not None else None
+
+        while not predicate() and self._queue:
+            due = self._queue[0][0]
+            if end is not None and due > end:
+                break
+            self.run(due - self.now)
+
+        return predicate()
+
+
+class FakePhotoImage:
+    """
+    Class for an image of known size which is never displayed
+    """
+
+    def __init__(self, image=None, width=0, height=0):
+        if image is not None:
+            width, height = image.width, image.height
+
+        self._width = width
+        self._height = height
+
+    def width(self):
+        return self._width
+
+    def height(self):
+        return self._height
+
+
+class _Item:
+    __slots__ = ('kind', 'x', 'y', 'anchor', 'tags', 'options', 'stack', 'cells')
+
+    def __init__(self, kind, x, y, anchor, tags, options, stack):
+        self.kind = kind
+        self.x = x
+        self.y = y
+        self.anchor = anchor
+        self.tags = tags
+        self.options = options
+        self.stack = stack  # position in the display list, higher is drawn above
+        self.cells = ()
+
+    def box(self):
+        """
+        Return the bounding box [x1, y1, x2, y2], images have a size, other items are points
+        """
+
+        image = self.options.get('image')
+        w = image.width() if image is not None else 0
+        h = image.height() if image is not None else 0
+
+        # Anchor is "center" or a compass direction such as "n" or "sw"
+        anchor = '' if self.anchor == 'center' else self.anchor
+        x1 = self.x - (0 if 'w' in anchor else w if 'e' in anchor else w / 2)
+        y1 = self.y - (0 if 'n' in anchor else h if 's' in anchor else h / 2)
+
+        return x1, y1, x1 + w, y1 + h
+
+
+class FakeCanvas:
+    """
+    Class for an in-memory canvas
+
+    It implements the part of Canvas that the components use. Items are kept in a uniform grid of cells,
+    so find_overlapping() only looks at the items near the area instead of every item.
+    Items covering more than max_cells cells, like backgrounds, are always looked at instead,
+    so that moving them does not touch hundreds of cells.
+    after() is run by a VirtualClock.
+    """
+
+    def __init__(self, width=0, height=0, clock=None, cell=64, max_cells=64):
+        self._width = width
+        self._height = height
+        self._cell = cell
+
+        self.clock = clock if clock is not None else VirtualClock()
+
+        self._items = {}
+        self._tags = {}  # tag -> set of ids
+        self._grid = {}  # (column, row) -> set of ids
+        self._large = set()  # ids of items not in the grid
+        self._max_cells = max_cells
+        self._ids = itertools.count(1)
+        self._top = 0
+        self._bottom = 0
+
+        self._bindings = {}
+
+    # Items
+
+    def _create(self, kind, x, y, anchor='center', tag=None, tags=None, **options):
+        item_id = next(self._ids)
+
+        names = set()
+        for value in (tag, tags):
+            if isinstance(value, str):
+                names.update(value.split())
+            elif value:
+                names.update(value)
+
+        self._top += 1
+        item = _Item(kind, x, y, anchor, names, options, self._top)
+        self._items[item_id] = item
+
+        for name in names:
+            self._tags.setdefault(name, set()).add(item_id)
+
+        self._index(item_id, item)
+        return item_id
+
+    def create_image(self, x, y, **options):
+        return self._create('image', x, y, **options)
+
+    def create_text(self, x, y, **options):
+        return self._create('text', x, y, **options)
+
+    def create_window(self, x, y, **options):
+        return self._create('window', x, y, **options)
+
+    def _find(self, tag_or_id):
+        """
+        Return the ids of the items of a tag or id
+        """
+
+        if isinstance(tag_or_id, int):
+            return [tag_or_id] if tag_or_id in self._items else []
+
+        if tag_or_id == 'all':
+            return list(self._items)
+
+        if isinstance(tag_or_id, str) and tag_or_id.isdigit():
+            return self._find(int(tag_or_id))
+
+        return list(self._tags.get(tag_or_id, ()))
+
+    def _index(self, item_id, item):
+        """
+        Put an item in the cells its bounding box covers
+        """
+
+        for cell in item.cells:
+            self._grid[cell].discard(item_id)
+
+        x1, y1, x2, y2 = item.box()
+        size = self._cell
+
+        columns = range(math.floor(x1 / size), math.floor(x2 / size) + 1)
+        rows = range(math.floor(y1 / size), math.floor(y2 / size) + 1)
+
+        if len(columns) * len(rows) > self._max_cells:
+            item.cells = ()
+            self._large.add(item_id)
+            return
+
+        self._large.discard(item_id)
+        item.cells = [(column, row) for column in columns for row in rows]
+
+        for cell in item.cells:
+            self._grid.setdefault(cell, set()).add(item_id)
+
+    def coords(self, tag_or_id, *args):
+        ids = self._find(tag_or_id)
+
+        if not args:
+            if not ids:
+                return []
+            item = self._items[ids[0]]
+            return [item.x, item.y]
+
+        if len(args) == 1:
+            args = args[0]
+
+        for item_id in ids:
+            item = self._items[item_id]
+            item.x, item.y = args[0], args[1]
+            self._index(item_id, item)
+
+    def move(self, tag_or_id, dx, dy):
+        for item_id in self._find(tag_or_id):
+            item = self._items[item_id]
+            item.x += dx
+            item.y += dy
+            self._index(item_id, item)
+
+    def bbox(self, *tags_or_ids):
+        boxes = [self._items[item_id].box() for tag in tags_or_ids for item_id in self._find(tag)]
+        if not boxes:
+            return None
+
+        return (int(min(box[0] for box in boxes)), int(min(box[1] for box in boxes)),
+                int(math.ceil(max(box[2] for box in boxes))), int(math.ceil(max(box[3] for box in boxes))))
+
+    def delete(self, *tags_or_ids):
+        for tag in tags_or_ids:
+            for item_id in self._find(tag):
+                item = self._items.pop(item_id)
+
+                for cell in item.cells:
+                    self._grid[cell].discard(item_id)
+                self._large.discard(item_id)
+                for name in item.tags:
+                    self._tags[name].discard(item_id)
+
+    def find_all(self):
+        return tuple(sorted(self._items, key=lambda item_id: self._items[item_id].stack))
+
+    def find_withtag(self, tag_or_id):
+        return tuple(sorted(self._find(tag_or_id), key=lambda item_id: self._items[item_id].stack))
+
+    def find_overlapping(self, x1, y1, x2, y2):
+        size = self._cell
+        candidates = set(self._large)
+
+        for column in range(math.floor(x1 / size), math.floor(x2 / size) + 1):
+            for row in range(math.floor(y1 / size), math.floor(y2 / size) + 1):
+                candidates.update(self._grid.get((column, row), ()))
+
+        found = []
+        for item_id in candidates:
+            box = self._items[item_id].box()
+            if box[0] <= x2 and box[2] >= x1 and box[1] <= y2 and box[3] >= y1:
+                found.append(item_id)
+
+        found.sort(key=lambda item_id: self._items[item_id].stack)
+        return tuple(found)
+
+    def tag_lower(self, tag_or_id, below=None):
+        for item_id in self.find_withtag(tag_or_id):
+            self._bottom -= 1
+            self._items[item_id].stack = self._bottom
+
+    def tag_raise(self, tag_or_id, above=None):
+        for item_id in self.find_withtag(tag_or_id):
+            self._top += 1
+            self._items[item_id].stack = self._top
+
+    def itemconfigure(self, tag_or_id, **options):
+        for item_id in self._find(tag_or_id):
+            item = self._items[item_id]
+            item.options.update(options)
+            if 'image' in options:
+                self._index(item_id, item)
+
+    itemconfig = itemconfigure
+
+    def itemcget(self, tag_or_id, option):
+        ids = self._find(tag_or_id)
+        return self._items[ids[0]].options.get(option) if ids else None
+
+    def type(self, tag_or_id):
+        ids = self._find(tag_or_id)
+        return self._items[ids[0]].kind if ids else None
+
+    # Time
+
+    def after(self, ms, func=None, *args):
+        return self.clock.after(ms, func, *args)
+
+    def after_idle(self, func, *args):
+        return self.clock.after(0, func, *args)
+
+    def after_cancel(self, handle):
+        self.clock.cancel(handle)
+
+    # Events
+
+    def bind(self, sequence, func=None, add=None):
+        if add:
+            self._bindings.setdefault(sequence, []).append(func)
+        else:
+            self._bindings[sequence] = [func]
+
+    def event_generate(self, sequence, **kwargs):
+        """
+        Call the functions bound to sequence
+        """
+
+        for func in self._bindings.get(sequence, ()):
+            func(None)
+
+    # Widget
+
+    def focus_force(self):
+        pass
+
+    def focus_set(self):
+        pass
+
+    def pack(self, **kwargs):
+        pass
+
+    def configure(self, **kwargs):
+        pass
+
+    config = configure
+
+    def update(self):
+        pass
+
+    def update_idletasks(self):
+        pass
+
+    def winfo_width(self):
+        return self._width
+
+    def winfo_height(self):
+        return self._height
+
+
+class FakeBackground(FakeCanvas, Background):
+    """
+    Class for a Background on a FakeCanvas
+    It is a Background, so Bird and Tubes accept it
+    It is to be created, as the Bird and Tubes on it, in a headless() block
+    """
+
+    def __init__(self, width, height, fp, scroll_speed=None, clock=None):
+        FakeCanvas.__init__(self, width=width, height=height, clock=clock)
+        self.setup(width, height, fp, scroll_speed)
+
+
+@contextmanager
+def headless():
+    """
+    Let get_photo_image create FakePhotoImages, which need no Tk instance, in a with block
+    The class of the images is put back after the block, and the fake sprites are dropped from sprite_cache
+    so that they are never given to a real Canvas
+    """
+
+    photo_image_class = utils.photo_image_class
+
+    utils.photo_image_class = FakePhotoImage
+    utils.sprite_cache.clear()
+
+    try:
+        yield
+    finally:
+        utils.photo_image_class = photo_image_class
+        utils.sprite_cache.clear()
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+
+"""
+Leaderboard class
+Every finished game kept in a local SQLite database, with indexes for the top scores and the best of each profile
+Created on 2026/10/18
+"""
+
+import os
+import threading
+import time
+from collections import namedtuple
+from contextlib import contextmanager
+
+Game = namedtuple('Game', ['profile', 'score', 'seed', 'duration', 'jumps', 'cause', 'time'])
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    profile TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    seed INTEGER,
+    duration REAL,
+    jumps INTEGER,
+    cause TEXT,
+    time REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS games_by_score ON games (score DESC, time);
+CREATE INDEX IF NOT EXISTS games_by_profile ON games (profile, score DESC);
+"""
+
+
+class Leaderboard:
+    """
+    Class for a leaderboard
+
+    The database is opened on first use, in whichever thread uses it first, and a lock lets
+    the game and background threads share it. Every game is committed in its own transaction,
+    in WAL mode a crash of the game loses nothing that has been added.
+    After close() it is opened for each use and closed again, so a game saved in the background
+    while the game exits is not lost and the database is not left open.
+    """
+
+    def __init__(self, fp):
+        self.fp = fp
+
+        self._db = None
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        if self._db is None:
+            # Imported here, it is slow to import and the database is usually opened in the background
+            import sqlite3
+
+            directory = os.path.dirname(self.fp)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            db = sqlite3.connect(self.fp, check_same_thread=False)
+            db.execute('PRAGMA journal_mode=WAL')
+            db.execute('PRAGMA synchronous=NORMAL')
+            db.executescript(_SCHEMA)
+            self._db = db
+
+        return self._db
+
+    @contextmanager
+    def _database(self):
+        """
+        Hold the lock and return the open database
+        """
+
+        with self._lock:
+            try:
+                yield self._connect()
+            finally:
+                if self._closed:
+                    self._disconnect()
+
+    def _disconnect(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def add(self, score, profile='', seed=None, duration=None, jumps=None, cause=None, finished=None):
+        """
+        Add a game, finished is the time it finished at (default: now)
+        """
+
+        game = (profile, score, seed, duration, jumps, cause, finished if finished is not None else time.time())
+
+        with self._database() as db:
+            with db:
+                db.execute('INSERT INTO games (profile, score, seed, duration, jumps, cause, time) '
+                           'VALUES (?, ?, ?, ?, ?, ?, ?)', game)
+
+    def import_bestscore(self, fp, profile=''):
+        """
+        Add the best score kept in fp by older versions of the game as a game of profile, once
+        fp is renamed to fp.imported, return the score or None if there was none
+        """
+
+        try:
+            with open(fp) as fin:
+                score = int(fin.read(), 16)
+        except (IOError, ValueError):
+            return None
+
+        self.add(score, profile=profile, cause="imported")
+        os.replace(fp, fp + '.imported')
+        return score
+
+    def top(self, n=5, profile=None):
+        """
+        Return the n best games, of every profile or of one profile, best first
+        Equal scores are ordered by who made them first
+        """
+
+        with self._database() as db:
+            if profile is None:
+                rows = db.execute('SELECT profile, score, seed, duration, jumps, cause, time FROM games '
+                                  'ORDER BY score DESC, time LIMIT ?', (n,))
+            else:
+                rows = db.execute('SELECT profile, score, seed, duration, jumps, cause, time FROM games '
+                                  'WHERE profile = ? ORDER BY score DESC LIMIT ?', (profile, n))
+
+            return [Game(*row) for row in rows]
+
+    def best(self, profile=None) -> int:
+        """
+        Return the best score, of every profile or of one profile, 0 if there is no game
+        """
+
+        with self._database() as db:
+            if profile is None:
+                row = db.execute('SELECT MAX(score) FROM games').fetchone()
+            else:
+                row = db.execute('SELECT MAX(score) FROM games WHERE profile = ?', (profile,)).fetchone()
+
+            return row[0] or 0
+
+    def __len__(self):
+        with self._database() as db:
+            return db.execute('SELECT COUNT(*) FROM games').fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            self._disconnect()
@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+
+"""
+Profiler and Hud classes
+Measure frame time, the cost of each subsystem of the game loop and the Tk calls per frame
+Created on 2026/10/18
+"""
+
+import csv
+import statistics
+import time
+from collections import deque
+
+
+class Profiler:
+    """
+    Class for a frame profiler
+
+    The game loop calls begin(), record() for each subsystem and end() every frame.
+    Event handlers call record() too, between two frames they are counted in the next one.
+    instrument() counts the calls to some methods of a canvas.
+    """
+
+    calls = ('move', 'coords', 'bbox', 'find_overlapping', 'create_image', 'delete', 'itemconfigure')
+
+    def __init__(self, window=600, history=0):
+        self._frames = deque(maxlen=window)  # the latest frames, for summary()
+        self._history = deque(maxlen=history) if history else None  # the latest history frames, for dump()
+        self._subsystems = []
+
+        self._canvas = None
+        self._originals = {}
+        self._counts = dict.fromkeys(self.calls, 0)
+
+        self._costs = {}
+        self._begin = None
+        self._last = None
+        self._interval = None
+
+    def instrument(self, canvas):
+        """
+        Count the calls to the methods in Profiler.calls of canvas
+        """
+
+        self._canvas = canvas
+
+        for name in self.calls:
+            method = getattr(canvas, name)
+            self._originals[name] = method
+            setattr(canvas, name, self._counter(name, method))
+
+    def original(self, name):
+        """
+        Return the method of the instrumented canvas which is not counted
+        """
+
+        return self._originals.get(name) or getattr(self._canvas, name)
+
+    def _counter(self, name, method):
+        counts = self._counts
+
+        def counted(*args, **kwargs):
+            counts[name] += 1
+            return method(*args, **kwargs)
+
+        return counted
+
+    def begin(self):
+        now = time.perf_counter()
+
+        # Time since the last frame, None for the first frame after stop()
+        self._interval = (now - self._last) * 1000 if self._last is not None else None
+        self._last = now
+        self._begin = now
+
+        for name in self._counts:
+            self._counts[name] = 0
+
+    def record(self, name, seconds):
+        if name not in self._costs:
+            self._costs[name] = 0
+            if name not in self._subsystems:
+                self._subsystems.append(name)
+
+        self._costs[name] += seconds * 1000
+
+    def end(self):
+        frame = {
+            'time': time.time(),
+            'interval_ms': self._interval,
+            'work_ms': (time.perf_counter() - self._begin) * 1000,
+            'items': len(self._canvas.find_all()) if self._canvas is not None else None,
+        }
+
+        for name, cost in self._costs.items():
+            frame[f'{name}_ms'] = cost
+
+        for name, count in self._counts.items():
+            frame[f'{name}_calls'] = count
+
+        self._frames.append(frame)
+        if self._history is not None:
+            self._history.append(frame)
+
+        self._costs = {}
+
+    def stop(self):
+        """
+        The loop stopped, the next frame does not follow the last one
+        """
+
+        self._last = None
+        self._costs = {}
+
+    def summary(self):
+        """
+        Return a summary of the latest frames
+        """
+
+        frames = list(self._frames)
+        if not frames:
+            return None
+
+        intervals = sorted(frame['interval_ms'] for frame in frames if frame['interval_ms'] is not None)
+
+        summary = {
+            'fps': 1000 / statistics.fmean(intervals) if intervals else 0,
+            'items': frames[-1]['items'],
+            'work_ms': statistics.fmean(frame['work_ms'] for frame in frames),
+        }
+
+        if len(intervals) >= 2:
+            q = statistics.quantiles(intervals, n=100, method='inclusive')
+            summary.update(p50=q[49], p95=q[94], p99=q[98])
+        else:
+            summary.update(p50=0, p95=0, p99=0)
+
+        summary['subsystems'] = {
+            name: statistics.fmean(frame.get(f'{name}_ms', 0) for frame in frames) for name in self._subsystems
+        }
+        summary['calls'] = {
+            name: statistics.fmean(frame[f'{name}_calls'] for frame in frames) for name in self.calls
+        }
+
+        return summary
+
+    def dump(self, fp):
+        """
+        Write the frames kept to a CSV file
+        """
+
+        frames = self._history if self._history is not None else list(self._frames)
+
+        fields = ['time', 'interval_ms', 'work_ms', 'items']
+        fields += [f'{name}_ms' for name in self._subsystems]
+        fields += [f'{name}_calls' for name in self.calls]
+
+        with open(fp, 'w', newline='') as fout:
+            writer = csv.DictWriter(fout, fieldnames=fields, restval='')
+            writer.writeheader()
+            writer.writerows(frames)
+
+
+class Hud:
+    """
+    Class for a head-up display of a Profiler, drawn as a text in the canvas
+    It is ticked by the game loop and redrawn every few frames
+    """
+
+    _tag = "Hud"
+
+    def __init__(self, canvas, profiler, every=15, font=("Courier", 12), fill="white"):
+        self._canvas = canvas
+        self._profiler = profiler
+        self._every = every
+        self._font = font
+        self._fill = fill
+
+        self._item = None
+        self._frames = 0
+        self.visible = False
+
+    def toggle(self):
+        self.visible = not self.visible
+
+        if self._item is not None:
+            self._profiler.original('itemconfigure')(self._item, state='normal' if self.visible else 'hidden')
+
+        if self.visible:
+            self.draw()
+
+    def reset(self):
+        """
+        The canvas has been cleared, the text will be created again
+        """
+
+        self._item = None
+
+    def tick(self, dt=None):
+        self._frames += 1
+
+        if self.visible and self._frames % self._every == 0:
+            self.draw()
+
+    def text(self):
+        summary = self._profiler.summary()
+        if summary is None:
+            return "Profiling..."
+
+        lines = [
+            f"FPS {summary['fps']:5.1f}  items {summary['items']}",
+            f"frame p50 {summary['p50']:5.1f}  p95 {summary['p95']:5.1f}  p99 {summary['p99']:5.1f} ms",
+            f"work {summary['work_ms']:6.3f} ms",
+        ]
+        lines += [f"  {name:<10} {cost:6.3f} ms" for name, cost in summary['subsystems'].items()]
+        lines += [f"  {name:<16} {count:6.1f}/frame" for name, count in summary['calls'].items() if count]
+
+        return "\n".join(lines)
+
+    def draw(self):
+        original = self._profiler.original
+
+        if self._item is None:
+            self._item = original('create_text')(10, 10, anchor='nw', text=self.text(), font=self._font,
+                                                 fill=self._fill, tag=self._tag)
+        else:
+            original('itemconfigure')(self._item, text=self.text())
+
+        # Keep the text above the tubes created after it
+        original('tag_raise')(self._item)
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+
+"""
+AdaptiveQuality class
+Shed render work when frames run late, and take it back when they are on time again.
+The world is advanced every frame whatever the level, only what is drawn changes
+    quality = AdaptiveQuality(loop.interval / 1000)
+    loop.add('quality', quality.tick)
+    loop.add('background', quality.wrap('background', background.tick))
+Created on 2026/10/18
+"""
+
+from functools import partial
+
+
+class AdaptiveQuality:
+    """
+    Class for adaptive quality
+
+    It is ticked by the game loop with the time of every frame. The time a frame takes beyond the interval
+    of the loop (the drawing of Tk, the work of the subsystems) is averaged, and when it stays over budget
+    for down_after seconds the level goes down, when it stays under half of it for up_after seconds the level
+    goes up. A level that has to be left again soon after going up waits twice as long before the next try.
+    Each level tells every how many frames a wrapped subsystem is ticked, with the time of all those frames,
+    0 being never. Subsystems that a level does not name are ticked every frame.
+    """
+
+    levels = (
+        {},  # full quality
+        {'background': 0},  # static background
+        {'background': 0, 'tubes': 2},  # coarser scroll steps of the tubes
+        {'background': 0, 'tubes': 3, 'hud': 4},  # fewer redraws of the decorative items
+    )
+
+    def __init__(self, interval, budget=0.25, down_after=0.5, up_after=3.0, max_up_after=60.0, smoothing=0.1):
+        self.interval = interval  # seconds of a frame
+        self.budget = budget * interval  # seconds a frame may take beyond interval
+        self.down_after = down_after
+        self.up_after = up_after
+        self.max_up_after = max_up_after
+        self.smoothing = smoothing
+
+        self.level = 0
+        self.worst = 0  # lowest quality (highest level) since reset()
+        self.changes = 0
+
+        self._late = 0  # average seconds that frames take beyond interval
+        self._slow = 0  # seconds that frames have been over budget
+        self._fast = 0  # seconds that frames have been well under budget
+        self._wait = up_after  # seconds of fast frames before the level goes up
+        self._since_up = None  # seconds since the level went up
+
+    def reset(self):
+        """
+        Forget the frames of the last game, the level is kept as the machine is the same
+        """
+
+        self.worst = self.level
+        self._late = 0
+        self._slow = 0
+        self._fast = 0
+
+    def wrap(self, name, tick):
+        """
+        Return a tick function for the game loop which ticks tick as often as the level lets it
+        """
+
+        state = [tick, 0, 0.0]  # tick, frames since it was ticked, seconds of those frames
+        return partial(self._tick_subsystem, name, state)
+
+    def _tick_subsystem(self, name, state, dt):
+        every = self.levels[self.level].get(name, 1)
+
+        if not every:
+            # Not drawn at this level, it does not catch up when it is drawn again
+            state[1] = 0
+            state[2] = 0.0
+            return
+
+        state[1] += 1
+        state[2] += dt
+
+        if state[1] >= every:
+            tick, dt = state[0], state[2]
+            state[1] = 0
+            state[2] = 0.0
+            tick(dt)
+
+    def tick(self, dt):
+        """
+        Measure a frame, and change the level if frames have been late or on time for long enough
+        """
+
+        self._late += (max(dt - self.interval, 0) - self._late) * self.smoothing
+
+        if self._since_up is not None:
+            self._since_up += dt
+
+        if self._late > self.budget:
+            self._slow += dt
+            self._fast = 0
+
+            if self._slow >= self.down_after and self.level < len(self.levels) - 1:
+                self._set_level(self.level + 1)
+
+                # Going up was too early
+                if self._since_up is not None and self._since_up < self._wait * 2:
+                    self._wait = min(self._wait * 2, self.max_up_after)
+                self._since_up = None
+
+        elif self._late < self.budget / 2:
+            self._fast += dt
+            self._slow = 0
+
+            if self._fast >= self._wait and self.level > 0:
+                self._set_level(self.level - 1)
+                self._since_up = 0
+
+        else:
+            self._slow = 0
+            self._fast = 0
+
+    def _set_level(self, level):
+        self.level = level
+        self.worst = max(self.worst, level)
+        self.changes += 1
+
+        self._slow = 0
+        self._fast = 0
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+
+"""
+Recording and replay of games
+A game is reproduced exactly by its seed, its World parameters and the steps at which the bird jumped.
+Created on 2026/10/18
+"""
+
+import struct
+
+from .engine import World
+
+JUMP = 1  # action of a jump
+
+_MAGIC = b'FBRP'
+_VERSION = 1
+
+# magic, version, seed, width, height, time step (microseconds), number of events
+_HEADER = struct.Struct('<4sBIHHII')
+
+
+class Recording:
+    """
+    Class for a recorded game
+    events is a list of (tick, action), tick being the number of steps the world had run before the action
+    """
+
+    def __init__(self, seed, screen_width, screen_height, time_step, events=None):
+        self.seed = seed
+        self.width = screen_width
+        self.height = screen_height
+        self.time_step = time_step
+        self.events = events if events is not None else []
+
+    @classmethod
+    def of(cls, world):
+        """
+        Return an empty recording of the parameters of a world, which must have a seed
+        """
+
+        if world.seed is None:
+            raise ValueError("Argument world must have a seed to be recorded")
+
+        return cls(world.seed, world.width, world.height, world.time_step)
+
+    def record(self, tick, action=JUMP):
+        self.events.append((tick, action))
+
+    def create_world(self, **kwargs):
+        """
+        Return a World that replays the recording
+        """
+
+        return World(self.width, self.height, time_step=self.time_step, seed=self.seed, script=self.events,
+                     **kwargs)
+
+    def save(self, fp):
+        """
+        Write the recording, ticks are stored as variable-length differences from the previous event
+        """
+
+        data = bytearray(_HEADER.pack(_MAGIC, _VERSION, self.seed, self.width, self.height,
+                                      round(self.time_step * 1000000), len(self.events)))
+
+        last = 0
+        for tick, action in self.events:
+            delta = tick - last
+            last = tick
+
+            while delta >= 0x80:
+                data.append(delta & 0x7f | 0x80)
+                delta >>= 7
+            data.append(delta)
+            data.append(action)
+
+        with open(fp, 'wb') as fout:
+            fout.write(data)
+
+    @classmethod
+    def load(cls, fp):
+        with open(fp, 'rb') as fin:
+            data = fin.read()
+
+        if len(data) < _HEADER.size:
+            raise ValueError(f'{fp} is too short to be a recording')
+
+        magic, version, seed, width, height, time_step, count = _HEADER.unpack_from(data)
+        if magic != _MAGIC:
+            raise ValueError(f'{fp} is not a recording of this game')
+        if version != _VERSION:
+            raise ValueError(f'{fp} is recorded by another version of the game')
+
+        events = []
+        position = _HEADER.size
+        tick = 0
+
+        try:
+            for _ in range(count):
+                delta = shift = 0
+                while True:
+                    byte = data[position]
+                    position += 1
+                    delta |= (byte & 0x7f) << shift
+                    shift += 7
+                    if byte < 0x80:
+                        break
+
+                tick += delta
+                events.append((tick, data[position]))
+                position += 1
+        except IndexError:
+            raise ValueError(f'{fp} is truncated') from None
+
+        return cls(seed, width, height, time_step / 1000000, events)
+
+
+def play(recording, max_time=3600):
+    """
+    Replay a recording without rendering, as fast as possible
+    Return the World at the end of the game
+    """
+
+    world = recording.create_world()
+    max_ticks = int(max_time / world.time_step)
+
+    while world.ticks < max_ticks and world.step():
+        pass
+
+    return world
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+
+"""
+AsyncGameLoop and AsyncRuntime classes
+Run the App under an asyncio event loop instead of mainloop(), so that blocking side work
+(saving scores and recordings, writing profiles, loading images) runs in threads without holding up a frame
+    runtime = AsyncRuntime()
+    app = App(runtime=runtime)
+    asyncio.run(runtime.run(app))
+Created on 2026/10/18
+"""
+
+import asyncio
+import sys
+import time
+from functools import partial
+from tkinter import TclError
+
+from .loop import GameLoop
+
+
+class AsyncGameLoop(GameLoop):
+    """
+    Class for a game loop which is a coroutine of the running asyncio event loop instead of a chain of after()
+    Frames are kept on a fixed schedule, a late frame shortens the wait for the next one
+    """
+
+    def __init__(self, widget, rate=60, max_delta=0.25, clock=time.monotonic):
+        GameLoop.__init__(self, widget, rate=rate, max_delta=max_delta, clock=clock)
+
+        self._task = None
+
+    def start(self):
+        if self._running:
+            return
+
+        self._running = True
+        self._last = None
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def stop(self):
+        GameLoop.stop(self)
+
+        # The task ends by itself when it stops the loop from a frame
+        if self._task is not None and self._task is not asyncio.current_task():
+            self._task.cancel()
+
+        self._task = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        interval = self.interval / 1000
+        deadline = loop.time()
+
+        while self._running:
+            deadline += interval
+            await asyncio.sleep(max(deadline - loop.time(), 0))
+
+            if not self._running:
+                break
+
+            try:
+                self._frame()
+            except Exception:
+                # Like an error in an after() callback, report it and end the chain
+                self._running = False
+                self._widget.report_callback_exception(*sys.exc_info())
+
+            # Do not try to catch up on the frames a stall has missed
+            deadline = max(deadline, loop.time() - interval)
+
+
+class AsyncRuntime:
+    """
+    Class for running an App under asyncio
+
+    Tk events are pumped by update() rate times per second, the game loop is an AsyncGameLoop
+    and submit() runs blocking work in a thread. The runtime waits for the work it was given before it exits.
+    """
+
+    def __init__(self, rate=120):
+
+        if not rate > 0:
+            raise ValueError("Argument rate must be positive")
+
+        self.rate = rate
+
+        self._app = None
+        self._tasks = set()
+        self._running = False
+
+    def create_loop(self, widget, rate=60):
+        return AsyncGameLoop(widget, rate=rate)
+
+    def submit(self, func, *args, callback=None):
+        """
+        Run func(*args) in a thread, then callback(result) in the event loop, where it may use Tk
+        """
+
+        task = asyncio.get_running_loop().create_task(asyncio.to_thread(func, *args))
+        task.add_done_callback(partial(self._done, callback=callback))
+        self._tasks.add(task)
+
+        return task
+
+    def _done(self, task, callback=None):
+        self._tasks.discard(task)
+
+        if task.cancelled():
+            return
+
+        error = task.exception()
+        if error is not None:
+            self._app.report_callback_exception(type(error), error, error.__traceback__)
+        elif callback is not None:
+            callback(task.result())
+
+    def pending(self):
+        return len(self._tasks)
+
+    def stop(self):
+        """
+        Stop pumping events, the app is destroyed once the submitted work is done
+        """
+
+        self._running = False
+
+    async def run(self, app):
+        """
+        Initialize app and run it until stop() is called or the window is destroyed
+        """
+
+        self._app = app
+        self._running = True
+
+        app.initialize()
+
+        try:
+            while self._running:
+                try:
+                    app.update()
+                except TclError:
+                    # The window has been destroyed
+                    break
+
+                await asyncio.sleep(1 / self.rate)
+
+        finally:
+            self._running = False
+
+            if self._tasks:
+                await asyncio.gather(*self._tasks, return_exceptions=True)
+
+            try:
+                app.destroy()
+            except TclError:
+                pass
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+
+"""
+TelemetryLog and FrameStats classes
+An append-only log with one JSON line per game, written by a background thread
+so that the game never waits for the disk
+Created on 2026/10/18
+"""
+
+import json
+import os
+import queue
+import statistics
+import threading
+from array import array
+
+
+class TelemetryLog:
+    """
+    Class for an append-only log of JSON lines
+
+    write() only puts the record in a queue. A writer thread takes what has arrived, at most batch records,
+    writes them in one go and flushes. When the file grows over max_bytes it is rotated:
+    fp becomes fp.1, fp.1 becomes fp.2 and so on, and the oldest of backups files is dropped.
+    """
+
+    def __init__(self, fp, max_bytes=5 * 1024 * 1024, backups=5, batch=64):
+        self.fp = fp
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.batch = batch
+
+        self._queue = queue.SimpleQueue()
+        self._closed = False
+        self.written = 0  # records written, for tests and reports
+        self.dropped = 0  # records that could not be written
+
+        self._thread = threading.Thread(target=self._run, name="telemetry", daemon=True)
+        self._thread.start()
+
+    def write(self, record):
+        """
+        Queue a record (a dict that json can encode), it is written by the writer thread
+        """
+
+        if self._closed:
+            raise ValueError("Cannot write to a closed TelemetryLog")
+
+        self._queue.put(record)
+
+    def close(self, timeout=None):
+        """
+        Write the queued records and stop the writer thread
+        """
+
+        if self._closed:
+            return
+
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    def _run(self):
+        fout = None
+
+        while True:
+            records = [self._queue.get()]
+
+            # Take whatever else is waiting, so a burst of records costs a single write and flush
+            while records[-1] is not None and len(records) < self.batch:
+                try:
+                    records.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = records[-1] is None
+            if stop:
+                records.pop()
+
+            if records:
+                try:
+                    fout = self._write(fout, records)
+                except OSError:
+                    # Telemetry must never take the game down, count what is lost instead
+                    self.dropped += len(records)
+                    fout = None
+
+            if stop:
+                break
+
+        if fout is not None:
+            fout.close()
+
+    def _write(self, fout, records):
+        """
+        Write records to the file, opening and rotating it as needed
+        Return the open file
+        """
+
+        lines = []
+        for record in records:
+            try:
+                lines.append(json.dumps(record, separators=(',', ':')) + '\n')
+            except (TypeError, ValueError):
+                self.dropped += 1
+
+        if fout is None:
+            directory = os.path.dirname(self.fp)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            fout = open(self.fp, 'a', encoding='utf-8')
+
+        fout.write(''.join(lines))
+        fout.flush()
+        self.written += len(lines)
+
+        if fout.tell() >= self.max_bytes:
+            fout.close()
+            self._rotate()
+            fout = open(self.fp, 'a', encoding='utf-8')
+
+        return fout
+
+    def _rotate(self):
+        for i in range(self.backups - 1, 0, -1):
+            if os.path.exists(f'{self.fp}.{i}'):
+                os.replace(f'{self.fp}.{i}', f'{self.fp}.{i + 1}')
+
+        if self.backups > 0:
+            os.replace(self.fp, f'{self.fp}.1')
+        else:
+            os.remove(self.fp)
+
+
+class FrameStats:
+    """
+    Class for the frame times of a game
+    Added to the game loop, it keeps the time of every frame it is ticked with
+    If loop is set the time is its frame_time instead, which is not clamped to max_delta, so stalls are kept
+    """
+
+    def __init__(self, loop=None):
+        self._loop = loop
+        self._times = array('f')  # ms
+
+    def tick(self, dt):
+        if self._loop is not None:
+            dt = self._loop.frame_time
+
+        self._times.append(dt * 1000)
+
+    def reset(self):
+        self._times = array('f')
+
+    def summary(self):
+        """
+        Return the number of frames and their mean, percentiles and maximum in ms
+        """
+
+        times = sorted(self._times)
+        if not times:
+            return {'frames': 0}
+
+        summary = {'frames': len(times), 'mean_ms': statistics.fmean(times), 'max_ms': times[-1]}
+
+        if len(times) >= 2:
+            q = statistics.quantiles(times, n=100, method='inclusive')
+            summary.update(p50_ms=q[49], p95_ms=q[94], p99_ms=q[98])
+        else:
+            summary.update(p50_ms=times[0], p95_ms=times[0], p99_ms=times[0])
+
+        return {key: round(value, 3) if isinstance(value, float) else value for key, value in summary.items()}
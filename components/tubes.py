@@ -7,196 +7,152 @@ Created on 2019/12/22
 
 __author__ = "Yihang Wu"
 
-import random
-from threading import Thread
+from collections import deque
+from tkinter import N, S
 
 from .background import Background
-from .bird import Bird
+from .engine import World
 from .utils import get_photo_image
 
 
-class Tubes(Thread):
+class Tubes:
     """
     Class for tubes
+    Render the tubes of a World and report its score
+    All tube items share a tag, so the tubes scroll with a single move() however many there are
     """
 
-    _distance = 0
-    _move = 10  # move steps
-    _past_tubes = []
+    _tag = "Tubes"
 
-    def __init__(self, background, bird, screen_width, screen_height, score_function,
-                 tube_body_fp, tube_mouth_fp, animation_speed):
+    def __init__(self, background, world, score_function, tube_body_fp, tube_mouth_fp):
 
         # Arguments Checking
         if not isinstance(background, Background):
             raise TypeError("Argument background must be an instance of Background.")
 
-        if not isinstance(bird, Bird):
-            raise TypeError("Argument bird must be an instance of Bird")
+        if not isinstance(world, World):
+            raise TypeError("Argument world must be an instance of World")
 
         if not callable(score_function):
             raise TypeError("Argument score_function must be a callable object")
 
-        Thread.__init__(self)
-
         # Instance parameters
         self._background = background
-        self._bird_w = bird.width
-        self._bird_h = bird.height
+        self._world = world
 
-        self._width = screen_width
-        self._height = screen_height
+        self._width = world.width
+        self._height = world.height
 
         self._score_method = score_function
-        self._animation_speed = animation_speed
-
-        self._image_w = int(0.1 * self._width)
-        self._image_h = int(0.05 * self._height)
+        self._score = 0  # score of the world that has been reported
 
-        # Create a list for tube body
-        self._tube_body_images = []
+        self._image_w = world.tube_w
+        self._image_h = world.tube_h
 
         self.tube_mouth_image = get_photo_image(
             image_path=tube_mouth_fp, width=self._image_w, height=self._image_h, close_after=True
         )[0]
 
-        # Get the tube body image, which is not a PhotoImage
+        # One body image as tall as the window is shared by every tube
+        # A tube shows the part of it between its mouth and the edge of the window
         self.tube_body_image = get_photo_image(
-            image_path=tube_body_fp, width=self._image_w, height=self._image_h
-        )[1]
+            image_path=tube_body_fp, width=self._image_w, height=self._height, close_after=True
+        )[0]
+
+        # Canvas items of the pairs of the world being drawn, from left to right,
+        # as (top mouth, top body, bottom mouth, bottom body), and the number of the left-most pair
+        self._tubes = deque()
+        self._first = world.tubes.first
 
-        # Minimum distance between two tubes
-        self._min_distance = int(self._image_w * 4.5)
+        # Scrolled distance of the world that the items are drawn at
+        self._scrolled = world.scrolled
 
-        self._stop = False
-        self._tubes = []
+        # Canvas items of the pairs that left the window, to be reused by new pairs
+        self._pool = []
 
-    def create_tubes_pair(self):
+    def create_tubes_pair(self, pair):
         """
-        Create a pair of tubes in the same x position
+        Draw a pair of tubes of the world, reusing the items of a pair that left if possible
         """
 
-        self._tube_body_images.append([])
-
-        # Tube --- Top
-        # A list for body of top tubes
-        top_tube = []
-
-        x = self._width + self._image_w
-
-        # Position y of the mouth of top tube
-        y = random.randint(self._image_h // 2, self._height - self._image_h - (self._bird_h * 2))
-
-        # Mouth of top tubes
-        top_tube.append(self._background.create_image(x, y, image=self.tube_mouth_image))
+        x = pair.x
 
-        # Create a new images in _tube_images[-1] representing the body of top tube
-        # whose height is the distance between ceiling and the center of the mouth of top tubes
-        self._tube_body_images[-1].append(get_photo_image(image=self.tube_body_image, width=self._image_w, height=y)[0])
+        # Position y of the mouth of top tube, and its top edge where the body ends
+        y = pair.y
+        y_body = y - self._image_h // 2
 
-        # Position y of the body of top tube
-        y_body = (y - self._image_h) // 2  # Do some math
+        # Position y of the mouth of bottom tube, and its bottom edge where the body starts
+        y_bottom = y + self._world.gap + self._image_h
+        y_bottom_body = y_bottom - self._image_h // 2 + self._image_h
 
-        # Body of top tube
-        top_tube.append(self._background.create_image(x, y_body, image=self._tube_body_images[-1][0]))
+        if self._pool:
+            items = self._pool.pop()
 
-        # ------------------------------------------------------
-        # ------------------------------------------------------
+            self._background.coords(items[0], x, y)
+            self._background.coords(items[1], x, y_body)
+            self._background.coords(items[2], x, y_bottom)
+            self._background.coords(items[3], x, y_bottom_body)
 
-        # Tube --- Bottom
-        bottom_tube = []
-
-        # Position y of the mouth of bottom tube
-        y += self._bird_h * 2 + self._image_h
-
-        # Mouth of bottom tube
-        bottom_tube.append(self._background.create_image(x, y, image=self.tube_mouth_image))
-
-        # Create a new images in _tube_images[-1] representing the body of bottom tube
-        self._tube_body_images[-1].append(
-            get_photo_image(image=self.tube_body_image, width=self._image_w, height=self._height - y)[0])
-
-        # Position y of body of bottom tube
-        y_body = (self._height + y + self._image_h) // 2  # Just do some math
-
-        # Body of buttom tube
-        bottom_tube.append(self._background.create_image(x, y_body, image=self._tube_body_images[-1][1]))
+        else:
+            items = (
+                # Tube --- Top
+                self._background.create_image(x, y, image=self.tube_mouth_image, tag=self._tag),
+                self._background.create_image(x, y_body, image=self.tube_body_image, anchor=S, tag=self._tag),
+                # Tube --- Bottom
+                self._background.create_image(x, y_bottom, image=self.tube_mouth_image, tag=self._tag),
+                self._background.create_image(x, y_bottom_body, image=self.tube_body_image, anchor=N, tag=self._tag)
+            )
 
         # Append this pair of tubes to self._tubes
-        self._tubes.append([top_tube, bottom_tube])
-
-        # Set the distance to 0
-        self._distance = 0
+        self._tubes.append(items)
 
-    def move(self):
+    def delete_tubes_pair(self):
         """
-        Move tubes
+        Release the items of the left-most pair of tubes
+        They are out of the window already, so they are left there (scrolling with the others) until reused
         """
 
-        # Record whether this pair of tubes have been passed and increased score
-        scored = False
+        self._pool.append(self._tubes.popleft())
+        self._first += 1
 
-        for tubes in self._tubes:
-            for tube in tubes:
-
-                # If this pair of tubes haven't scored, check if we should score it
-                if not scored:
-
-                    # Coordinate x2 of the mouth of top tube
-                    t_x2 = self._background.bbox(tube[0])[2]
-
-                    # Coordinate x1 of the bird
-                    b_x1 = (self._width - self._bird_w) / 2
-
-                    # If the bird will pass the tubes at this move...
-                    if b_x1 - self._move < t_x2 <= b_x1:
-
-                        if tube[0] not in self._past_tubes:
-                            self._score_method()
-                            self._past_tubes.append(tube[0])
-                            scored = True
-
-                for part in tube:
-                    self._background.move(part, -self._move, 0)
-
-    def run(self) -> None:
-        if self._stop:
-            return
-
-        # Eliminate the tubes that are out from left side
-        # check if x2 of the left-most top tube's mouth is smaller than 0
-        if len(self._tubes) > 0 and self._background.bbox(self._tubes[0][0][0])[2] <= 0:
-            # print(self._tubes) -> shape = [n, 2, 2]
-            # [
-            #   [[60, 61], [62, 63]],
-            #   [[64, 65], [66, 67]],
-            #   [[69, 70], [71, 72]]
-            # ]
+    def draw(self, dt=None):
+        """
+        Bring the tubes on the canvas up to date with the world
+        """
 
-            # print(self._tube_images) -> shape = [n, 2]
+        world_tubes = self._world.tubes
 
-            for tube in self._tubes[0]:
-                for part in tube:
-                    self._background.delete(part)
+        # Eliminate the tubes that the world has dropped
+        while self._tubes and self._first < world_tubes.first:
+            self.delete_tubes_pair()
 
-            self._tube_body_images.remove(self._tube_body_images[0])  #
+        # Pairs may have come and gone without being drawn
+        if self._first < world_tubes.first:
+            self._first = world_tubes.first
 
-            self._tubes.remove(self._tubes[0])
+        # Move all tubes at once
+        dx = self._scrolled - self._world.scrolled
+        if dx:
+            self._background.move(self._tag, dx, 0)
+            self._scrolled = self._world.scrolled
 
-            self._past_tubes.remove(self._past_tubes[0])
+        # Create the tubes that the world has spawned
+        while self._first + len(self._tubes) < world_tubes.end:
+            self.create_tubes_pair(world_tubes.pair(self._first + len(self._tubes)))
 
-        # Whether to create a pair of tubes or not
-        if self._distance >= self._min_distance:
-            self.create_tubes_pair()
-        else:
-            self._distance += self._move
+    def tick(self, dt=None):
+        """
+        Draw the tubes and report new score, called by the game loop after the world is advanced
+        """
 
-        self.move()
-        self._background.after(self._animation_speed, self.run)
+        self.draw()
+        self.report_score()
 
-    def stop(self):
-        self._stop = True
+    def report_score(self, dt=None):
+        """
+        Call the score function once for every point the world has scored since the last call
+        """
 
-    def resume(self):
-        self._stop = False
-        self.run()
+        while self._score < self._world.score:
+            self._score += 1
+            self._score_method()
@@ -6,24 +6,179 @@ Created on 2019/12/22
 """
 
 import time
+from collections import OrderedDict
 from datetime import timedelta
 
-import PIL.Image
-from PIL.ImageTk import PhotoImage
+# PIL is imported on first use, it takes longer to import than the rest of the game
 
 __author__ = "Yihang Wu"
 
 
-def get_photo_image(image=None, image_path=None, width=None, height=None, close_after=False):
+class SpriteCache:
+    """
+    A bounded LRU cache of sprites loaded from disk
+    Keyed by (path, width, height, resample), the value is the PhotoImage, which holds its own copy of the pixels
+    PhotoImages belong to the Tk instance that is running, clear() the cache when it is destroyed
+    """
+
+    def __init__(self, maxsize=32):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._sprites = OrderedDict()
+
+    def __len__(self):
+        return len(self._sprites)
+
+    def get(self, key):
+        """
+        Return the cached sprite of key, or None
+        """
+
+        sprite = self._sprites.get(key)
+
+        if sprite is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._sprites.move_to_end(key)
+
+        return sprite
+
+    def put(self, key, sprite):
+        """
+        Cache a sprite, evicting the least recently used ones beyond maxsize
+        """
+
+        self._sprites[key] = sprite
+        self._sprites.move_to_end(key)
+
+        while len(self._sprites) > self.maxsize:
+            self.evict(next(iter(self._sprites)))
+
+    def evict(self, key):
+        """
+        Remove the sprite of key from the cache
+        """
+
+        # A PhotoImage that a component still shows is kept alive by the component
+        self._sprites.pop(key, None)
+
+    def clear(self):
+        for key in list(self._sprites):
+            self.evict(key)
+
+        self.hits = 0
+        self.misses = 0
+
+    def info(self):
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self._sprites), 'maxsize': self.maxsize}
+
+
+sprite_cache = SpriteCache()
+
+# Class of the images created by get_photo_image, replaced when running without a display
+photo_image_class = None  # class of the images created, PIL.ImageTk.PhotoImage unless it is replaced
+atlas = None  # an Atlas of pre-scaled sprites that images are taken from before they are loaded from their files
+
+
+def _photo_image(image):
+    global photo_image_class
+
+    if photo_image_class is None:
+        from PIL.ImageTk import PhotoImage
+        photo_image_class = PhotoImage
+
+    return photo_image_class(image)
+
+
+def get_photo_image(image=None, image_path=None, width=None, height=None, close_after=False, resample=None):
     """
     Get (PhotoImage, image_resized, image)
+    The PhotoImages of image_path are cached in sprite_cache, without the images of PIL they are made of.
+    Without close_after the images are loaded again for the caller, who closes them
+    If the atlas has the image at that size, it is sliced out of the atlas and image is None
     """
 
     if not image:
         if not image_path:
             return
 
-        image = PIL.Image.open(image_path)
+        key = (image_path, width, height, resample)
+        photo_image = sprite_cache.get(key)
+
+        if photo_image is not None:
+            if close_after:
+                return photo_image, None, None
+
+            return (photo_image,) + load_image(image_path, width, height, resample)
+
+        image_resized = atlas.get(image_path, width, height) if atlas is not None and resample is None else None
+
+        if image_resized is not None:
+            image = None
+        else:
+            image_resized, image = load_image(image_path, width, height, resample)
+
+        photo_image = _photo_image(image_resized)
+        sprite_cache.put(key, photo_image)
+
+        if close_after:
+            _close(image_resized, image)
+            return photo_image, None, None
+
+        return photo_image, image_resized, image
+
+    photo_image, image_resized, image = _resize(image, width, height, resample)
+
+    # If close_after
+    if close_after:
+        _close(image_resized, image)
+        image_resized = None
+        image = None
+
+    return photo_image, image_resized, image
+
+
+def load_image(image_path, width=None, height=None, resample=None):
+    """
+    Open and resize an image without creating a PhotoImage, so that it can be done in another thread
+    Return (image_resized, image)
+    """
+
+    import PIL.Image
+
+    image = PIL.Image.open(image_path)
+    image_resized = image.resize([width or image.width, height or image.height], resample=resample)
+
+    return image_resized, image
+
+
+def cache_image(image_path, width, height, resample, images):
+    """
+    Put the (image_resized, image) of load_image() in sprite_cache, for get_photo_image() to find
+    The PhotoImage is created here, so it must be called in the thread of Tk
+    """
+
+    key = (image_path, width, height, resample)
+    image_resized, image = images
+
+    if sprite_cache.get(key) is None:
+        sprite_cache.put(key, _photo_image(image_resized))
+
+    _close(image_resized, image)
+
+
+def _close(*images):
+    for image in images:
+        if image is not None:
+            image.close()
+
+
+def _resize(image, width, height, resample):
+    """
+    Return (PhotoImage, image_resized, image)
+    """
 
     if not width:
         width = image.width
@@ -31,18 +186,10 @@ def get_photo_image(image=None, image_path=None, width=None, height=None, close_
         height = image.height
 
     # Resize the image
-    image_resized = image.resize([width, height])
+    image_resized = image.resize([width, height], resample=resample)
 
     # Create a PhotoImage object
-    photo_image = PhotoImage(image_resized)
-
-    # If close_after
-    if close_after:
-        image_resized.close()
-        image_resized = None
-
-        image.close()
-        image = None
+    photo_image = _photo_image(image_resized)
 
     return photo_image, image_resized, image
 
@@ -126,6 +273,13 @@ class Timer:
         else:
             return self._accumulated_time + time.time() - self._last_time
 
+    def seconds(self):
+        """
+        Return the time counted in seconds
+        """
+
+        return self._gettime()
+
     def __str__(self):
         return str(timedelta(seconds=int(self._gettime())))
 
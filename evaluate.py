@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+
+"""
+Evaluate a jump policy by playing many headless games in a process pool
+A policy is a function of the observation of World.observe() that returns whether to jump.
+    python evaluate.py --policy evaluate:follow_gap --games 10000
+Created on 2026/10/18
+"""
+
+import argparse
+import json
+import os
+import statistics
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from importlib import import_module
+
+from components.engine import World
+
+
+def follow_gap(observation):
+    """
+    Jump when the bird is lower than the middle of the next gap
+    """
+
+    y, velocity, distance, top, bottom = observation
+    return y > (top + bottom) / 2 + (bottom - top) / 6 and velocity >= 0
+
+
+def never(observation):
+    """
+    Never jump
+    """
+
+    return False
+
+
+def load_policy(policy):
+    """
+    Return the policy callable of "module:function", or policy itself if it is callable
+    """
+
+    if callable(policy):
+        return policy
+
+    module, _, name = policy.partition(':')
+    if not name:
+        raise ValueError(f'Policy must be given as "module:function", got {policy!r}')
+
+    return getattr(import_module(module), name)
+
+
+def play(seed, policy, screen_width=1920, screen_height=1080, max_time=300):
+    """
+    Play a game until the bird dies or max_time seconds of game time have passed
+    Return (seed, score, survival time, cause)
+    """
+
+    policy = load_policy(policy)
+    world = World(screen_width, screen_height, seed=seed)
+    max_ticks = int(max_time / world.time_step)
+
+    while world.ticks < max_ticks:
+        if not world.step(policy(world.observe())):
+            break
+
+    return seed, world.score, world.elapsed, world.cause or "timeout"
+
+
+def _play_chunk(seeds, **kwargs):
+    return [play(seed, **kwargs) for seed in seeds]
+
+
+def _percentiles(values):
+    if len(values) < 2:
+        return {'p50': values[0], 'p90': values[0], 'p99': values[0]} if values else {}
+
+    q = statistics.quantiles(values, n=100, method='inclusive')
+    return {'p50': q[49], 'p90': q[89], 'p99': q[98]}
+
+
+def summarize(results):
+    """
+    Aggregate the results of play()
+    """
+
+    scores = [result[1] for result in results]
+    times = [result[2] for result in results]
+
+    return {
+        'games': len(results),
+        'score': {
+            'mean': statistics.fmean(scores) if scores else 0,
+            'max': max(scores, default=0),
+            **_percentiles(sorted(scores)),
+            'distribution': {str(k): v for k, v in sorted(Counter(scores).items())},
+        },
+        'time': {
+            'mean': statistics.fmean(times) if times else 0,
+            'max': max(times, default=0),
+            **_percentiles(sorted(times)),
+        },
+        'causes': dict(Counter(result[3] for result in results)),
+    }
+
+
+def evaluate(policy, seeds, screen_width=1920, screen_height=1080, max_time=300, workers=None):
+    """
+    Play a game for each seed across a process pool and return the summary of results
+    Policy should be a "module:function" string or a picklable callable
+    """
+
+    seeds = list(seeds)
+    workers = workers or os.cpu_count() or 1
+
+    # A few chunks per worker keeps the pool busy without a round trip per game
+    size = max(1, len(seeds) // (workers * 4))
+    chunks = [seeds[i:i + size] for i in range(0, len(seeds), size)]
+
+    job = partial(_play_chunk, policy=policy, screen_width=screen_width, screen_height=screen_height,
+                  max_time=max_time)
+
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk in executor.map(job, chunks):
+            results.extend(chunk)
+
+    return summarize(results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play headless games in parallel and report statistics")
+    parser.add_argument('--policy', default='evaluate:follow_gap', help='policy as "module:function"')
+    parser.add_argument('--games', type=int, default=1000, help='number of games')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the first game, then counting up')
+    parser.add_argument('--workers', type=int, default=None, help='number of processes (default: CPU count)')
+    parser.add_argument('--width', type=int, default=1920, help='screen width')
+    parser.add_argument('--height', type=int, default=1080, help='screen height')
+    parser.add_argument('--max-time', type=float, default=300, help='seconds of game time before a game stops')
+    args = parser.parse_args()
+
+    load_policy(args.policy)  # fail early on a bad policy
+
+    stats = evaluate(args.policy, range(args.seed, args.seed + args.games), screen_width=args.width,
+                     screen_height=args.height, max_time=args.max_time, workers=args.workers)
+
+    print(json.dumps(stats, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -25,6 +25,33 @@ class Settings:
 
     # Configuration for Animation
     background_animation = True
+    game_tick_rate = 60  # ticks per second of the game loop
+    async_event_rate = 120  # times per second that Tk events are processed when run with --asyncio
+
+    # Configuration for adaptive quality
+    adaptive_quality = False  # draw less (a static background, coarser tube steps) when frames run late
+
+    # Configuration for profiling
+    profile_history = 36000  # frames written by --profile-out, the last 10 minutes at 60 ticks per second
+
+    # Configuration for leaderboard
+    player_profile = "default"  # profile that games are saved under
+    leaderboard_size = 5  # number of top scores shown on the scoreboard
+
+    # Configuration for telemetry
+    telemetry_enabled = True  # append a record of every game to telemetry_fp
+    telemetry_max_bytes = 5 * 1024 * 1024  # size at which the log is rotated
+    telemetry_backups = 5  # number of rotated logs kept
+
+    # Configuration for startup
+    startup_lazy_assets = False  # show the window first and load every image the first time it is shown
+
+    # Configuration for autopilot
+    autopilot = False  # fly every game with the autopilot and start the next game by itself, e.g. on a kiosk
+                       # window_autopilot_event turns it on and off in game
+    autopilot_horizon = 0.5  # seconds that the autopilot plans ahead
+    autopilot_budget_ms = 2  # ms of a frame that the autopilot may search for
+    autopilot_restart_ms = 3000  # ms the menu is shown before the autopilot starts a game
 
     # Configuration for buttons
     button_scaled_width = 0.22
@@ -57,10 +84,14 @@ class Settings:
     window_exit_event = '<Escape>'
     window_pause_event = '<p>'
     window_pause_2_event = '<P>'
+    window_hud_event = '<F3>'
+    window_autopilot_event = '<F2>'
 
     # File Path
-    bestscore_fp = 'data/bsc.txt'
+    bestscore_fp = 'data/bsc.txt'  # best score of older versions, moved into the leaderboard
+    leaderboard_fp = 'data/leaderboard.sqlite3'
     settings_fp = 'data/settings.json'
+    telemetry_fp = 'data/telemetry.jsonl'
 
     background_fp = 'images/background.png'
     bird_fp = 'images/bird.png'
@@ -78,7 +109,8 @@ class Settings:
         Get settings from existed json file or create one from default settings
         """
 
-        attributes = ["window_fullscreen", "window_width", "window_height"]
+        attributes = ["window_fullscreen", "window_width", "window_height", "game_tick_rate", "startup_lazy_assets",
+                      "telemetry_enabled", "player_profile", "autopilot", "adaptive_quality"]
 
         # from existed file
         try:
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+"""
+Tests of the autopilot
+Created on 2026/10/18
+"""
+
+import itertools
+import unittest
+
+from components.autopilot import Autopilot
+from components.engine import World
+
+
+def fly(world, autopilot, seconds, steps_per_frame=4):
+    """
+    Let the autopilot fly the bird for seconds of game time, planning every frame as the game loop
+    Return whether the bird is alive
+    """
+
+    world.pilot = autopilot
+
+    while world.bird.alive and world.elapsed < seconds:
+        autopilot.tick()
+        for _ in range(steps_per_frame):
+            world.step()
+
+    return world.bird.alive
+
+
+class AutopilotTest(unittest.TestCase):
+
+    def test_survives(self):
+        # A budget larger than the one of the game, so that a busy machine does not make the test fail
+        for seed in (0, 1):
+            world = World(1920, 1080, seed=seed)
+            autopilot = Autopilot(world, budget=0.05)
+
+            self.assertTrue(fly(world, autopilot, 60), f"seed {seed} died of {world.cause} at {world.elapsed} s")
+            self.assertGreater(world.score, 10)
+
+    def test_other_window_size(self):
+        world = World(800, 600, seed=2)
+        self.assertTrue(fly(world, Autopilot(world, budget=0.05), 30))
+
+    def test_out_of_time(self):
+        # A clock that runs a second per call, every search stops at once
+        clock = itertools.count()
+        world = World(1920, 1080, seed=0)
+        autopilot = Autopilot(world, clock=lambda: next(clock))
+
+        fly(world, autopilot, 5)
+
+        self.assertGreater(autopilot.searches, 0)
+        self.assertEqual(autopilot.timeouts, autopilot.searches)
+
+    def test_budget(self):
+        with self.assertRaises(ValueError):
+            Autopilot(World(1920, 1080), budget=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
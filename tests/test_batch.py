@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+"""
+Tests of BatchWorld against World
+Created on 2026/10/18
+"""
+
+import unittest
+
+try:
+    import numpy as np
+    from components.batch import BatchWorld
+except ImportError:
+    np = None
+
+from components.engine import World
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class BatchWorldTest(unittest.TestCase):
+
+    def test_same_as_world(self):
+        """
+        Every bird of a batch lives the game of a World of the same seed, with the same jumps
+        """
+
+        n = 20
+        seed = 3
+        thresholds = np.linspace(0.2, 0.9, n) * 1080
+
+        for immortal in (False, True):
+            batch = BatchWorld(n, 1920, 1080, seed=seed, immortal=immortal)
+            worlds = [World(1920, 1080, seed=seed, immortal=immortal) for _ in range(n)]
+
+            for _ in range(5000):
+                batch.step(batch.y > thresholds)
+
+                for i, world in enumerate(worlds):
+                    if world.bird.alive:
+                        world.step(world.bird.y > thresholds[i])
+
+            for i, world in enumerate(worlds):
+                self.assertEqual(batch.alive[i], world.bird.alive)
+                self.assertEqual(batch.ticks[i], world.ticks)
+                self.assertEqual(batch.score[i], world.score)
+                self.assertAlmostEqual(batch.y[i], world.bird.y)
+
+            # The birds do not all live the same game
+            self.assertGreater(len(set(batch.ticks)) if not immortal else batch.score.max(), 1)
+
+    def test_dead_birds_stay(self):
+        batch = BatchWorld(3, 800, 600, seed=0)
+
+        for _ in range(3000):
+            batch.step()
+
+        self.assertFalse(batch.alive.any())
+        y = batch.y.copy()
+
+        batch.step(np.ones(3, dtype=bool))
+        np.testing.assert_array_equal(batch.y, y)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+
+"""
+Tests of the ring of tubes of the World
+Created on 2026/10/18
+"""
+
+import unittest
+
+from components.engine import TubeRing, World
+
+
+class TubeRingTest(unittest.TestCase):
+
+    def test_wrap_around(self):
+        ring = TubeRing(4)
+
+        # Spawn and drop pairs so that they go round the ring several times
+        for number in range(10):
+            ring.append(number, -number)
+            if len(ring) == 3:
+                ring.popleft()
+
+        self.assertEqual((ring.first, ring.end), (8, 10))
+        self.assertEqual(len(ring.slots), 4)
+        self.assertEqual([pair.x for pair in ring], [8, 9])
+        self.assertEqual(ring.pair(9).y, -9)
+        self.assertEqual(ring[0].x, 8)
+        self.assertEqual(ring[-1].x, 9)
+
+        with self.assertRaises(IndexError):
+            ring.pair(7)
+        with self.assertRaises(IndexError):
+            ring[2]
+
+    def test_iterate_across_the_end(self):
+        ring = TubeRing(4)
+
+        for number in range(6):
+            ring.append(number, 0)
+        for _ in range(3):
+            ring.popleft()
+
+        # Pairs 3, 4 and 5 are in slots 3, 0 and 1
+        self.assertEqual([pair.x for pair in ring], [3, 4, 5])
+
+    def test_grow(self):
+        ring = TubeRing(2)
+
+        ring.append(0, 0)
+        ring.popleft()
+        for number in range(1, 6):
+            ring.append(number, 0)
+
+        self.assertGreaterEqual(len(ring.slots), 5)
+        self.assertEqual([pair.x for pair in ring], [1, 2, 3, 4, 5])
+        self.assertEqual([ring.pair(number).x for number in range(1, 6)], [1, 2, 3, 4, 5])
+
+    def test_pop_empty(self):
+        ring = TubeRing(2)
+        ring.append(0, 0)
+        ring.clear()
+
+        self.assertEqual(len(ring), 0)
+        self.assertEqual(list(ring), [])
+        with self.assertRaises(IndexError):
+            ring.popleft()
+
+    def test_world_capacity(self):
+        # The ring of a World never has to grow
+        for width, height in ((1920, 1080), (800, 600), (640, 1136)):
+            world = World(width, height, seed=0, immortal=True)
+            capacity = len(world.tubes.slots)
+
+            for _ in range(20000):
+                world.step(world.bird.y > height * 0.6)
+
+            self.assertGreater(world.tubes.first, 0)
+            self.assertEqual(len(world.tubes.slots), capacity)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+"""
+Tests of the training environments
+Created on 2026/10/18
+"""
+
+import unittest
+
+try:
+    import numpy as np
+    from components.env import FlappyEnv, VectorEnv
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class VectorEnvTest(unittest.TestCase):
+
+    def test_same_as_flappy_env(self):
+        """
+        Every game of a VectorEnv is the game of FlappyEnv of its seed, step by step, across resets
+        """
+
+        for width, height, frame_skip in ((1920, 1080, 1), (800, 600, 4)):
+            k = 8
+            vector = VectorEnv(k, width, height, frame_skip=frame_skip, max_time=30, seed=0)
+            envs = [FlappyEnv(width, height, frame_skip=frame_skip, max_time=30) for _ in range(k)]
+
+            observations = vector.reset()
+            for i, env in enumerate(envs):
+                np.testing.assert_array_equal(env.reset(int(vector.seeds[i])), observations[i])
+
+            # Thresholds of the jumps differ between the games, so that some of them die early
+            thresholds = np.linspace(0, 0.3, k)
+            dones_total = 0
+
+            for _ in range(3000):
+                gap = observations[:, 4] - observations[:, 3]
+                actions = ((observations[:, 0] > observations[:, 3] + gap * (0.5 + thresholds))
+                           & (observations[:, 1] >= 0)).astype(int)
+
+                observations, rewards, dones, info = vector.step(actions)
+
+                for i, env in enumerate(envs):
+                    observation, reward, done, env_info = env.step(actions[i])
+
+                    self.assertEqual(reward, rewards[i])
+                    self.assertEqual(done, dones[i])
+                    self.assertEqual(env_info['score'], info['score'][i])
+                    self.assertEqual(env_info['truncated'], info['truncated'][i])
+
+                    if done:
+                        dones_total += 1
+                        observation = env.reset(int(vector.seeds[i]))
+
+                    np.testing.assert_array_equal(observation, observations[i])
+
+            self.assertGreater(dones_total, 0)
+
+    def test_actions_shape(self):
+        vector = VectorEnv(4, seed=0)
+        vector.reset()
+
+        with self.assertRaises(ValueError):
+            vector.step([1, 0])
+
+
+if __name__ == '__main__':
+    unittest.main()
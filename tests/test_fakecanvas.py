@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+
+"""
+Tests of the FakeCanvas and its VirtualClock
+Created on 2026/10/18
+"""
+
+import random
+import unittest
+
+try:
+    from components.fakecanvas import FakeCanvas, FakePhotoImage, VirtualClock
+except ImportError:
+    FakeCanvas = None
+
+
+def overlaps(box, x1, y1, x2, y2):
+    return box[0] <= x2 and box[2] >= x1 and box[1] <= y2 and box[3] >= y1
+
+
+@unittest.skipIf(FakeCanvas is None, "tkinter is not installed")
+class FakeCanvasTest(unittest.TestCase):
+
+    def setUp(self):
+        self.canvas = FakeCanvas(800, 600)
+
+    def boxes(self):
+        return {item_id: self.canvas.bbox(item_id) for item_id in self.canvas.find_all()}
+
+    def assert_find_overlapping(self, x1, y1, x2, y2):
+        # The grid must find what looking at every item finds
+        expected = {item_id for item_id, box in self.boxes().items() if overlaps(box, x1, y1, x2, y2)}
+        self.assertEqual(set(self.canvas.find_overlapping(x1, y1, x2, y2)), expected)
+
+    def test_find_overlapping(self):
+        generator = random.Random(0)
+
+        # Small items, and large ones kept out of the grid
+        # Sizes are even and positions whole, so that bbox() is the exact box of an item
+        for _ in range(200):
+            image = FakePhotoImage(width=2 * generator.randint(1, 60), height=2 * generator.randint(1, 60))
+            self.canvas.create_image(generator.randint(-100, 900), generator.randint(-100, 700), image=image,
+                                     anchor=generator.choice(['center', 'n', 'sw', 'e']), tag="Small")
+        for _ in range(3):
+            self.canvas.create_image(400, 300, image=FakePhotoImage(width=800, height=600), tag="Large")
+
+        for _ in range(50):
+            x, y = generator.uniform(-50, 850), generator.uniform(-50, 650)
+            self.assert_find_overlapping(x, y, x + generator.uniform(0, 200), y + generator.uniform(0, 200))
+
+        # Moved and deleted items leave their cells
+        self.canvas.move("Small", -37, 12)
+        self.canvas.delete(*self.canvas.find_withtag("Small")[::3])
+        self.canvas.move("Large", 300, 0)
+
+        for _ in range(50):
+            x, y = generator.uniform(-50, 850), generator.uniform(-50, 650)
+            self.assert_find_overlapping(x, y, x + generator.uniform(0, 200), y + generator.uniform(0, 200))
+
+    def test_find_overlapping_order(self):
+        image = FakePhotoImage(width=10, height=10)
+        below = self.canvas.create_image(100, 100, image=image)
+        above = self.canvas.create_image(100, 100, image=image)
+
+        self.assertEqual(self.canvas.find_overlapping(95, 95, 105, 105), (below, above))
+
+        self.canvas.tag_raise(below)
+        self.assertEqual(self.canvas.find_overlapping(95, 95, 105, 105), (above, below))
+
+    def test_coords_and_bbox(self):
+        item = self.canvas.create_image(10, 20, image=FakePhotoImage(width=4, height=6), anchor='nw')
+
+        self.assertEqual(self.canvas.bbox(item), (10, 20, 14, 26))
+
+        self.canvas.coords(item, 50, 60)
+        self.assertEqual(self.canvas.coords(item), [50, 60])
+        self.assertEqual(self.canvas.find_overlapping(0, 0, 20, 30), ())
+        self.assertEqual(self.canvas.find_overlapping(51, 61, 52, 62), (item,))
+
+
+@unittest.skipIf(FakeCanvas is None, "tkinter is not installed")
+class VirtualClockTest(unittest.TestCase):
+
+    def test_order_and_cancel(self):
+        clock = VirtualClock()
+        calls = []
+
+        clock.after(30, calls.append, 'c')
+        clock.after(10, calls.append, 'a')
+        cancelled = clock.after(20, calls.append, 'b')
+        clock.cancel(cancelled)
+
+        clock.run(25)
+        self.assertEqual(calls, ['a'])
+        self.assertEqual(clock.now, 25)
+
+        clock.run(5)
+        self.assertEqual(calls, ['a', 'c'])
+        self.assertEqual(clock.pending(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
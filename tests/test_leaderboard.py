@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+"""
+Tests of the leaderboard
+Created on 2026/10/18
+"""
+
+import os
+import tempfile
+import unittest
+
+from components.leaderboard import Leaderboard
+
+
+class LeaderboardTest(unittest.TestCase):
+
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.directory = self._directory.name
+        self.leaderboard = Leaderboard(os.path.join(self.directory, 'data', 'leaderboard.sqlite3'))
+
+    def tearDown(self):
+        self.leaderboard.close()
+        self._directory.cleanup()
+
+    def test_empty(self):
+        self.assertEqual(self.leaderboard.top(5), [])
+        self.assertEqual(self.leaderboard.best(), 0)
+        self.assertEqual(len(self.leaderboard), 0)
+
+    def test_top(self):
+        for i, (profile, score) in enumerate([('a', 3), ('b', 9), ('a', 7), ('b', 1), ('a', 9), ('c', 5)]):
+            self.leaderboard.add(score, profile=profile, seed=i, finished=1000 + i)
+
+        top = self.leaderboard.top(3)
+
+        # Equal scores are ordered by who made them first
+        self.assertEqual([(game.profile, game.score) for game in top], [('b', 9), ('a', 9), ('a', 7)])
+        self.assertEqual(top[0].seed, 1)
+
+        self.assertEqual([game.score for game in self.leaderboard.top(2, profile='a')], [9, 7])
+        self.assertEqual(self.leaderboard.best('b'), 9)
+        self.assertEqual(self.leaderboard.best('c'), 5)
+        self.assertEqual(self.leaderboard.best('nobody'), 0)
+        self.assertEqual(len(self.leaderboard), 6)
+
+    def test_reopen(self):
+        self.leaderboard.add(4, profile='a')
+        self.leaderboard.close()
+
+        self.assertEqual(self.leaderboard.best('a'), 4)
+
+    def test_add_after_close(self):
+        # A game saved in the background while the game exits
+        self.leaderboard.close()
+        self.leaderboard.add(6, profile='a')
+
+        self.assertIsNone(self.leaderboard._db)
+        self.assertEqual(self.leaderboard.best('a'), 6)
+        self.assertIsNone(self.leaderboard._db)
+
+    def test_import_bestscore(self):
+        fp = os.path.join(self.directory, 'bsc.txt')
+        with open(fp, 'w') as fout:
+            fout.write(hex(42))
+
+        self.assertEqual(self.leaderboard.import_bestscore(fp, profile='a'), 42)
+        self.assertEqual(self.leaderboard.best('a'), 42)
+        self.assertEqual(self.leaderboard.top(1)[0].cause, 'imported')
+
+        # Only once
+        self.assertFalse(os.path.exists(fp))
+        self.assertTrue(os.path.exists(fp + '.imported'))
+        self.assertIsNone(self.leaderboard.import_bestscore(fp, profile='a'))
+        self.assertEqual(len(self.leaderboard), 1)
+
+    def test_import_bad_bestscore(self):
+        fp = os.path.join(self.directory, 'bsc.txt')
+        with open(fp, 'w') as fout:
+            fout.write('not a score')
+
+        self.assertIsNone(self.leaderboard.import_bestscore(fp))
+        self.assertEqual(len(self.leaderboard), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
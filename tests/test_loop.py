@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+
+"""
+Tests of the GameLoop
+Created on 2026/10/18
+"""
+
+import unittest
+
+from components.loop import GameLoop
+
+
+class Widget:
+    """
+    A widget whose after() callbacks are run by run(), in order of time
+    """
+
+    def __init__(self):
+        self.now = 0  # ms
+        self.pending = {}  # handle -> (due, callback)
+        self._count = 0
+
+    def after(self, ms, func):
+        self._count += 1
+        handle = f"after#{self._count}"
+        self.pending[handle] = (self.now + ms, func)
+        return handle
+
+    def after_cancel(self, handle):
+        self.pending.pop(handle, None)
+
+    def run(self, ms):
+        end = self.now + ms
+
+        while self.pending:
+            handle = min(self.pending, key=lambda name: self.pending[name][0])
+            due, func = self.pending[handle]
+            if due > end:
+                break
+
+            del self.pending[handle]
+            self.now = due
+            func()
+
+        self.now = end
+
+
+class GameLoopTest(unittest.TestCase):
+
+    def setUp(self):
+        self.widget = Widget()
+        self.loop = GameLoop(self.widget, rate=50, clock=lambda: self.widget.now / 1000)
+        self.frames = []
+        self.loop.add('frames', self.frames.append)
+
+    def test_order(self):
+        ticked = []
+        self.loop.clear()
+        for name in ('world', 'bird', 'tubes'):
+            self.loop.add(name, lambda dt, name=name: ticked.append(name))
+
+        self.loop.start()
+        self.widget.run(self.loop.interval)
+
+        self.assertEqual(ticked, ['world', 'bird', 'tubes'])
+
+    def test_start_twice(self):
+        self.loop.start()
+        self.loop.start()
+
+        self.assertEqual(len(self.widget.pending), 1)
+
+        self.widget.run(1000)
+        self.assertEqual(len(self.frames), 1000 // self.loop.interval)
+
+    def test_stop_cancels(self):
+        self.loop.start()
+        self.widget.run(100)
+        self.loop.stop()
+
+        self.assertFalse(self.loop.running())
+        self.assertEqual(self.widget.pending, {})
+
+        count = len(self.frames)
+        self.widget.run(1000)
+        self.assertEqual(len(self.frames), count)
+
+    def test_restart_keeps_one_chain(self):
+        for _ in range(5):
+            self.loop.start()
+            self.widget.run(10)
+            self.loop.stop()
+            self.loop.start()
+
+        self.assertEqual(len(self.widget.pending), 1)
+
+    def test_stop_in_a_subsystem(self):
+        ticked = []
+        self.loop.clear()
+        self.loop.add('bird', lambda dt: self.loop.stop())
+        self.loop.add('tubes', ticked.append)
+
+        self.loop.start()
+        self.widget.run(1000)
+
+        self.assertEqual(ticked, [])
+        self.assertEqual(self.widget.pending, {})
+
+    def test_delta_time(self):
+        self.loop.start()
+        self.widget.run(100)
+
+        self.assertEqual([round(dt, 6) for dt in self.frames], [0.02] * 5)
+
+    def test_delta_time_clamped(self):
+        def stall(dt):
+            if len(self.frames) == 3:
+                self.widget.now += 900
+
+        self.loop.add('stall', stall)
+        self.loop.start()
+        self.widget.run(2000)
+
+        self.assertEqual([round(dt, 6) for dt in self.frames[:3]], [0.02] * 3)
+        self.assertEqual(self.frames[3], self.loop.max_delta)
+        self.assertLessEqual(max(self.frames), self.loop.max_delta)
+
+    def test_first_frame_after_start(self):
+        self.loop.start()
+        self.widget.run(100)
+        self.loop.stop()
+
+        # The pause is not a frame
+        self.widget.run(5000)
+        self.loop.start()
+        self.widget.run(20)
+
+        self.assertAlmostEqual(self.frames[-1], 0.02)
+
+    def test_deadlines(self):
+        # 60 frames a second although 1000 / 60 ms is not a whole number of ms
+        loop = GameLoop(self.widget, rate=60, clock=lambda: self.widget.now / 1000)
+        frames = []
+        loop.add('frames', frames.append)
+
+        loop.start()
+        self.widget.run(1000)
+        self.assertEqual(len(frames), 60)
+
+        # Callbacks run 5 ms late, the next waits are shorter so the rate holds
+        after = self.widget.after
+        self.widget.after = lambda ms, func: after(ms + 5, func)
+        self.widget.run(1000)
+        self.assertIn(len(frames), (119, 120))
+
+    def test_rate(self):
+        with self.assertRaises(ValueError):
+            GameLoop(self.widget, rate=0)
+
+        with self.assertRaises(TypeError):
+            self.loop.add('nothing', None)
+
+
+if __name__ == '__main__':
+    unittest.main()
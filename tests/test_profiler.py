@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+"""
+Tests of the frame profiler
+Created on 2026/10/18
+"""
+
+import csv
+import os
+import tempfile
+import unittest
+
+from components.engine import World
+from components.profiler import Profiler
+
+try:
+    from components.bird import Bird
+    from components.fakecanvas import FakeBackground, headless
+except ImportError:
+    Bird = None
+
+
+class ProfilerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.profiler = Profiler(window=10, history=5)
+
+    def frame(self, **costs):
+        self.profiler.begin()
+        for name, seconds in costs.items():
+            self.profiler.record(name, seconds)
+        self.profiler.end()
+
+    def test_event_between_frames(self):
+        self.frame(world=0.001)
+
+        # A jump is handled between two frames, it is counted in the next one only
+        self.profiler.record('jump', 0.002)
+        self.frame(world=0.001)
+        self.frame(world=0.001)
+
+        summary = self.profiler.summary()
+        self.assertEqual(list(summary['subsystems']), ['world', 'jump'])
+        self.assertAlmostEqual(summary['subsystems']['jump'], 2 / 3)
+
+    def test_history(self):
+        for _ in range(8):
+            self.frame(world=0.001)
+
+        with tempfile.TemporaryDirectory() as directory:
+            fp = os.path.join(directory, 'frames.csv')
+            self.profiler.dump(fp)
+
+            with open(fp, newline='') as fin:
+                rows = list(csv.DictReader(fin))
+
+        self.assertEqual(len(rows), 5)
+        self.assertIn('world_ms', rows[0])
+
+
+@unittest.skipIf(Bird is None, "tkinter is not installed")
+class BirdProfilerTest(unittest.TestCase):
+
+    def test_jump(self):
+        world = World(1920, 1080, seed=0)
+        with headless():
+            background = FakeBackground(1920, 1080, fp='images/background.png')
+            bird = Bird(background, world, lambda: None, 'images/bird.png')
+
+        profiler = Profiler()
+        bird.profiler = profiler
+
+        bird.start()
+        background.event_generate('<Up>')
+
+        profiler.begin()
+        profiler.end()
+
+        self.assertEqual(world.jumps, 1)
+        self.assertIn('jump', profiler.summary()['subsystems'])
+
+
+if __name__ == '__main__':
+    unittest.main()
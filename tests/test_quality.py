@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+
+"""
+Tests of the adaptive quality
+Created on 2026/10/18
+"""
+
+import unittest
+
+from components.quality import AdaptiveQuality
+
+INTERVAL = 1 / 60
+SLOW = 2 * INTERVAL  # a frame that takes twice the interval
+FAST = INTERVAL
+
+
+def until_change(quality, dt, limit=60):
+    """
+    Tick frames of dt until the level changes, return the seconds it took or None
+    """
+
+    level = quality.level
+    seconds = 0
+
+    while seconds < limit:
+        quality.tick(dt)
+        seconds += dt
+        if quality.level != level:
+            return seconds
+
+    return None
+
+
+class AdaptiveQualityTest(unittest.TestCase):
+
+    def setUp(self):
+        self.quality = AdaptiveQuality(INTERVAL)
+
+    def test_steps_down(self):
+        seconds = until_change(self.quality, SLOW)
+
+        # The average has to reach the budget before down_after seconds are counted
+        self.assertGreaterEqual(seconds, self.quality.down_after)
+        self.assertLess(seconds, self.quality.down_after + 0.2)
+        self.assertEqual(self.quality.level, 1)
+
+        # Down to the lowest level, no further
+        until_change(self.quality, SLOW)
+        until_change(self.quality, SLOW)
+        self.assertIsNone(until_change(self.quality, SLOW, limit=5))
+        self.assertEqual(self.quality.level, len(AdaptiveQuality.levels) - 1)
+        self.assertEqual(self.quality.worst, self.quality.level)
+
+    def test_steps_up(self):
+        until_change(self.quality, SLOW)
+        seconds = until_change(self.quality, FAST)
+
+        self.assertGreaterEqual(seconds, self.quality.up_after)
+        self.assertLess(seconds, self.quality.up_after + 0.5)
+        self.assertEqual(self.quality.level, 0)
+        self.assertEqual(self.quality.worst, 1)
+        self.assertEqual(self.quality.changes, 2)
+
+        # Full quality is the highest level
+        self.assertIsNone(until_change(self.quality, FAST, limit=10))
+
+    def test_on_time(self):
+        self.assertIsNone(until_change(self.quality, FAST, limit=10))
+        self.assertEqual(self.quality.changes, 0)
+
+    def test_backs_off(self):
+        until_change(self.quality, SLOW)
+        first = until_change(self.quality, FAST)
+
+        # Late again soon after going up, the next try waits twice as long
+        until_change(self.quality, SLOW)
+        second = until_change(self.quality, FAST)
+
+        self.assertGreaterEqual(second, 2 * self.quality.up_after)
+        self.assertGreater(second, first + self.quality.up_after / 2)
+
+    def test_reset(self):
+        until_change(self.quality, SLOW)
+        self.quality.reset()
+
+        self.assertEqual(self.quality.level, 1)
+        self.assertEqual(self.quality.worst, 1)
+
+    def test_wrap(self):
+        ticks = {'background': [], 'tubes': [], 'bird': []}
+        wrapped = {name: self.quality.wrap(name, calls.append) for name, calls in ticks.items()}
+
+        def frames(count):
+            for _ in range(count):
+                for tick in wrapped.values():
+                    tick(0.25)
+
+        frames(2)
+        self.assertEqual(ticks['tubes'], [0.25, 0.25])
+
+        # The background is not drawn, the tubes are drawn every other frame with the time of both
+        self.quality.level = 2
+        frames(4)
+        self.assertEqual(ticks['background'], [0.25, 0.25])
+        self.assertEqual(ticks['tubes'], [0.25, 0.25, 0.5, 0.5])
+        self.assertEqual(len(ticks['bird']), 6)
+
+        # The background does not catch up the frames it was not drawn
+        self.quality.level = 0
+        frames(1)
+        self.assertEqual(ticks['background'], [0.25, 0.25, 0.25])
+
+
+if __name__ == '__main__':
+    unittest.main()
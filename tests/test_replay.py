@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+"""
+Tests of the recording and replay of games
+Created on 2026/10/18
+"""
+
+import os
+import tempfile
+import unittest
+
+from components.engine import World
+from components.replay import Recording, play
+from evaluate import follow_gap
+
+
+class RecordingTest(unittest.TestCase):
+
+    def play_recorded(self, seed, seconds=60):
+        """
+        Play a game of follow_gap, which stops jumping after seconds so that the bird dies
+        Return its World and its Recording
+        """
+
+        world = World(1920, 1080, seed=seed)
+        recording = Recording.of(world)
+        world.recorder = recording
+
+        while world.step(world.elapsed < seconds and follow_gap(world.observe())):
+            pass
+
+        return world, recording
+
+    def test_save_load(self):
+        world, recording = self.play_recorded(seed=7)
+        self.assertGreater(len(recording.events), 0)
+
+        with tempfile.TemporaryDirectory() as directory:
+            fp = os.path.join(directory, 'game.fbr')
+            recording.save(fp)
+            loaded = Recording.load(fp)
+
+        self.assertEqual((loaded.seed, loaded.width, loaded.height), (world.seed, world.width, world.height))
+        self.assertEqual(vars(loaded), vars(recording))
+
+    def test_replay(self):
+        for seed in (0, 1, 2 ** 32 - 1):
+            world, recording = self.play_recorded(seed)
+
+            with tempfile.TemporaryDirectory() as directory:
+                fp = os.path.join(directory, 'game.fbr')
+                recording.save(fp)
+                replayed = play(Recording.load(fp))
+
+            self.assertIsNotNone(world.cause)
+            self.assertEqual((replayed.score, replayed.ticks, replayed.jumps, replayed.cause),
+                             (world.score, world.ticks, world.jumps, world.cause))
+            self.assertEqual(replayed.bird.y, world.bird.y)
+
+    def test_load_other_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            fp = os.path.join(directory, 'game.fbr')
+            with open(fp, 'wb') as fout:
+                fout.write(b'\0' * 64)
+
+            with self.assertRaises(ValueError):
+                Recording.load(fp)
+
+    def test_load_truncated(self):
+        world, recording = self.play_recorded(seed=3)
+
+        with tempfile.TemporaryDirectory() as directory:
+            fp = os.path.join(directory, 'game.fbr')
+            recording.save(fp)
+
+            with open(fp, 'rb') as fin:
+                data = fin.read()
+
+            for size in (0, 10, len(data) - 1):
+                with open(fp, 'wb') as fout:
+                    fout.write(data[:size])
+
+                with self.assertRaises(ValueError):
+                    Recording.load(fp)
+
+    def test_world_without_seed(self):
+        with self.assertRaises(ValueError):
+            Recording.of(World(1920, 1080))
+
+
+if __name__ == '__main__':
+    unittest.main()
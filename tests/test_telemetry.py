@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+"""
+Tests of the telemetry log
+Created on 2026/10/18
+"""
+
+import json
+import os
+import tempfile
+import unittest
+
+from components.telemetry import FrameStats, TelemetryLog
+
+
+class TelemetryLogTest(unittest.TestCase):
+
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.directory = self._directory.name
+        self.fp = os.path.join(self.directory, 'data', 'telemetry.jsonl')
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def read(self, fp):
+        with open(fp, encoding='utf-8') as fin:
+            return [json.loads(line) for line in fin]
+
+    def test_write(self):
+        log = TelemetryLog(self.fp)
+        for i in range(10):
+            log.write({'game': i})
+        log.close()
+
+        self.assertEqual(self.read(self.fp), [{'game': i} for i in range(10)])
+        self.assertEqual((log.written, log.dropped), (10, 0))
+
+    def test_rotation(self):
+        # A record is about 40 bytes, the log is rotated every few records
+        log = TelemetryLog(self.fp, max_bytes=200, backups=2, batch=1)
+        for i in range(100):
+            log.write({'game': i, 'padding': 'x' * 20})
+        log.close()
+
+        names = sorted(os.listdir(os.path.dirname(self.fp)))
+        self.assertEqual(names, ['telemetry.jsonl', 'telemetry.jsonl.1', 'telemetry.jsonl.2'])
+
+        # The newest records are kept, in order, the oldest files are dropped
+        games = [record['game'] for fp in (self.fp + '.2', self.fp + '.1', self.fp) for record in self.read(fp)]
+        self.assertEqual(games, list(range(games[0], 100)))
+
+        for fp in (self.fp + '.1', self.fp + '.2'):
+            self.assertGreaterEqual(os.path.getsize(fp), 200)
+
+    def test_no_backups(self):
+        log = TelemetryLog(self.fp, max_bytes=100, backups=0, batch=1)
+        for i in range(20):
+            log.write({'game': i, 'padding': 'x' * 20})
+        log.close()
+
+        self.assertEqual(os.listdir(os.path.dirname(self.fp)), ['telemetry.jsonl'])
+
+    def test_bad_record_is_dropped(self):
+        log = TelemetryLog(self.fp)
+        log.write({'game': 0})
+        log.write({'game': object()})
+        log.write({'game': 2})
+        log.close()
+
+        self.assertEqual(self.read(self.fp), [{'game': 0}, {'game': 2}])
+        self.assertEqual(log.dropped, 1)
+
+    def test_write_after_close(self):
+        log = TelemetryLog(self.fp)
+        log.close()
+
+        with self.assertRaises(ValueError):
+            log.write({'game': 0})
+
+
+class FrameStatsTest(unittest.TestCase):
+
+    def test_summary(self):
+        stats = FrameStats()
+        self.assertEqual(stats.summary(), {'frames': 0})
+
+        for ms in range(1, 101):
+            stats.tick(ms / 1000)
+
+        summary = stats.summary()
+        self.assertEqual(summary['frames'], 100)
+        self.assertEqual(summary['max_ms'], 100)
+        self.assertAlmostEqual(summary['mean_ms'], 50.5, places=3)
+        self.assertAlmostEqual(summary['p50_ms'], 50.5, places=3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+
+"""
+Tests of the sprite cache
+Created on 2026/10/18
+"""
+
+import unittest
+
+try:
+    from components.utils import SpriteCache
+except ImportError:
+    SpriteCache = None
+
+try:
+    from components import utils
+    from components.fakecanvas import FakePhotoImage, headless
+    from components.utils import cache_image, get_photo_image, load_image
+except ImportError:
+    headless = None
+
+
+@unittest.skipIf(SpriteCache is None, "PIL is not installed")
+class SpriteCacheTest(unittest.TestCase):
+
+    def test_least_recently_used_is_evicted(self):
+        cache = SpriteCache(maxsize=3)
+
+        for key in 'abc':
+            cache.put(key, key.upper())
+
+        # a is used, so b is the least recently used
+        self.assertEqual(cache.get('a'), 'A')
+        cache.put('d', 'D')
+
+        self.assertEqual(len(cache), 3)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual([cache.get(key) for key in 'acd'], ['A', 'C', 'D'])
+
+    def test_put_again_refreshes(self):
+        cache = SpriteCache(maxsize=2)
+
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.put('a', 3)
+        cache.put('c', 4)
+
+        self.assertEqual(cache.get('a'), 3)
+        self.assertIsNone(cache.get('b'))
+
+    def test_counters(self):
+        cache = SpriteCache(maxsize=2)
+
+        cache.put('a', 1)
+        cache.get('a')
+        cache.get('a')
+        cache.get('b')
+
+        self.assertEqual(cache.info(), {'hits': 2, 'misses': 1, 'size': 1, 'maxsize': 2})
+
+        cache.clear()
+        self.assertEqual(cache.info(), {'hits': 0, 'misses': 0, 'size': 0, 'maxsize': 2})
+
+    def test_evict(self):
+        cache = SpriteCache()
+
+        cache.put('a', 1)
+        cache.evict('a')
+        cache.evict('missing')
+
+        self.assertEqual(len(cache), 0)
+
+
+@unittest.skipIf(headless is None, "PIL or tkinter is not installed")
+class GetPhotoImageTest(unittest.TestCase):
+
+    fp = 'images/bird.png'
+
+    def setUp(self):
+        atlas = utils.atlas
+        utils.atlas = None
+        self.addCleanup(setattr, utils, 'atlas', atlas)
+
+    def test_only_the_photo_image_is_cached(self):
+        with headless():
+            photo_image, image_resized, image = get_photo_image(image_path=self.fp, width=30, height=20,
+                                                                close_after=True)
+
+            self.assertIsInstance(photo_image, FakePhotoImage)
+            self.assertIsNone(image_resized)
+            self.assertIsNone(image)
+            self.assertIs(utils.sprite_cache.get((self.fp, 30, 20, None)), photo_image)
+
+            # The same PhotoImage, without decoding the file again
+            self.assertIs(get_photo_image(image_path=self.fp, width=30, height=20, close_after=True)[0],
+                          photo_image)
+
+    def test_images_for_the_caller(self):
+        with headless():
+            first = get_photo_image(image_path=self.fp, width=30, height=20)
+            second = get_photo_image(image_path=self.fp, width=30, height=20)
+
+        self.assertIs(first[0], second[0])
+        self.assertIsNot(first[1], second[1])
+        self.assertEqual(second[1].size, (30, 20))
+
+        for images in (first, second):
+            images[1].close()
+            images[2].close()
+
+    def test_cache_image(self):
+        with headless():
+            image_resized, image = load_image(self.fp, 30, 20)
+            cache_image(self.fp, 30, 20, None, (image_resized, image))
+
+            self.assertEqual(utils.sprite_cache.get((self.fp, 30, 20, None)).width(), 30)
+
+        # The images of PIL are closed once the PhotoImage is made
+        with self.assertRaises(ValueError):
+            image_resized.load()
+
+
+if __name__ == '__main__':
+    unittest.main()